@@ -4,34 +4,82 @@
 
 import asyncio
 import socket
+import functools
 import argparse
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from vidgear.gears.asyncio import NetGear_Async
 import cv2
+import numpy as np
 
 DOCKER_HOST_OPTION: typing.Final[str] = "docker_host"
 CONTAINER_OPTION: typing.Final[str] = "container"
 REMOTE_OPTION: typing.Final[str] = "remote"
+# any routable address works, UDP socket connection only selects outgoing interface and sends no packets
+_ROUTE_PROBE_ADDRESS: typing.Final[typing.Tuple[str, int]] = ("10.255.255.255", 1)
 
+# all OpenCV GUI calls are done in one dedicated thread, so displaying does not block receiving coroutine
+_DISPLAY_EXECUTOR: typing.Final[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1)
 
-async def receiver_func() -> None:
+
+def show_frame(frame: np.array) -> None:
+    """
+    Shows the frame in the output window. Planar YUV 4:2:0 frames (2D arrays) are converted into BGR and JPEG frames
+    (1D arrays) are decoded first.
+
+    Args:
+        frame (np.array): Received frame.
+
+    Returns (None):
+    """
+    if frame.ndim == 2:
+        frame = cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_I420)
+    elif frame.ndim == 1:
+        frame = cv2.imdecode(frame, cv2.IMREAD_COLOR)
+    cv2.imshow("Output Frame", frame)
+    _ = cv2.waitKey(1) & 0xFF
+
+
+async def receive_and_display() -> None:
+    """
+    Connects to *Metron Conduit*, receives frames, prints them into console and shows them. Used in case of
+    <DOCKER_HOST_OPTION>.
+
+    Returns (None):
+    """
+    loop = asyncio.get_event_loop()
+    async for frame in client.recv_generator():
+        print(frame)
+        await loop.run_in_executor(_DISPLAY_EXECUTOR, show_frame, frame)
+
+
+async def receive_and_print() -> None:
     """
-    Connects to *Metron Conduit*, receives and processes frames. In case of <DOCKER_HOST_OPTION>, it shows received
-    frames. In case of <CONTAINER_OPTION>, it only prints numpy arrays into console, because Docker containers do not
-    have displaying option by default.
+    Connects to *Metron Conduit*, receives frames and only prints numpy arrays into console. Used in case of
+    <CONTAINER_OPTION> and <REMOTE_OPTION>, because Docker containers do not have displaying option by default.
 
     Returns (None):
     """
     async for frame in client.recv_generator():
         print(frame)
 
-        if args.host_type == DOCKER_HOST_OPTION:
-            cv2.imshow("Output Frame", frame)
-            _ = cv2.waitKey(1) & 0xFF
 
-        await asyncio.sleep(0.00001)
+def get_local_ip_address() -> str:
+    """
+    Returns IP address of the interface used for outgoing traffic. The address is taken from the socket routing table
+    lookup, so no DNS resolution is needed. If there is no route, hostname resolution is used as a fallback.
+
+    Returns (str): IP address string representation.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe_socket:
+        try:
+            probe_socket.connect(_ROUTE_PROBE_ADDRESS)
+            return typing.cast(str, probe_socket.getsockname()[0])
+        except OSError:
+            return socket.gethostbyname(socket.gethostname())
 
 
+@functools.lru_cache(maxsize=4)
 def get_ip_address(host_type: str) -> typing.Optional[str]:
     """
     Returns IP address based on host type.
@@ -44,10 +92,8 @@ def get_ip_address(host_type: str) -> typing.Optional[str]:
     """
     if host_type == DOCKER_HOST_OPTION:
         return "127.0.0.1"
-    if host_type == CONTAINER_OPTION:
-        return socket.gethostbyname(socket.gethostname())
-    if host_type == REMOTE_OPTION:
-        return socket.gethostbyname(socket.gethostname())
+    if host_type in (CONTAINER_OPTION, REMOTE_OPTION):
+        return get_local_ip_address()
 
     return None
 
@@ -74,10 +120,13 @@ if __name__ == "__main__":
 
     asyncio.set_event_loop(client.loop)
     try:
+        # receiving coroutine is selected once, so the host type is not checked per frame
+        receiver_func = receive_and_display if args.host_type == DOCKER_HOST_OPTION else receive_and_print
         client.loop.run_until_complete(receiver_func())
     except (KeyboardInterrupt, SystemExit):
         pass
 
     if args.host_type == DOCKER_HOST_OPTION:
-        cv2.destroyAllWindows()
+        _DISPLAY_EXECUTOR.submit(cv2.destroyAllWindows).result()
+    _DISPLAY_EXECUTOR.shutdown()
     client.close()
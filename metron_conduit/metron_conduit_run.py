@@ -4,20 +4,31 @@ The script runs *Metron Conduit* component.
 
 
 import os
+import typing
+import inspect
 import hydra
 from miscellaneous.metron_conduit_config_schema import metron_conduit_config_schema_registration
 from miscellaneous import metron_conduit_utils
 from shared import metron_globals
-from shared.config import set_hydra_config
+from shared.config import set_hydra_config, cache_hydra_config
 from shared.config_schema import create_structured_config_schema
 from metron_conduit.video_streamer.streamer_manager import StreamerManager
 from metron_conduit.miscellaneous.metron_conduit_config_schema import MetronConduitConfigSchema
 
 
+CONFIG_DIR: typing.Final[str] = os.path.join(os.getcwd(), "conf")
+CONFIG_CACHE_FILE: typing.Final[str] = os.path.join(os.path.expanduser("~"), ".cache", "metron", "conduit_config.yaml")
+CONFIG_CACHE_ENABLED: typing.Final[bool] = os.environ.get("METRON_CONDUIT_CONFIG_CACHE", "0") == "1"
+
+
 @create_structured_config_schema(metron_conduit_config_schema_registration)
-@hydra.main(
-    config_path=f"{os.path.join(os.getcwd(), 'conf')}", config_name="metron_conduit_config"
-)  # type: ignore[misc]
+@cache_hydra_config(
+    config_dir=CONFIG_DIR,
+    cache_file=CONFIG_CACHE_FILE,
+    source_files=[inspect.getfile(MetronConduitConfigSchema)],
+    enabled=CONFIG_CACHE_ENABLED,
+)
+@hydra.main(config_path=CONFIG_DIR, config_name="metron_conduit_config")  # type: ignore[misc]
 @set_hydra_config
 def main(hydra_config: MetronConduitConfigSchema) -> None:  # pylint: disable=unused-argument
     """
@@ -28,12 +39,13 @@ def main(hydra_config: MetronConduitConfigSchema) -> None:  # pylint: disable=un
 
     Returns (None):
     """
+    metron_conduit_utils.set_cpu_affinity()
     source_connector = metron_conduit_utils.instantiate_source_connector()
     streamer_manager = StreamerManager(source_connector)
     metron_conduit_utils.setup_streamer_workers(streamer_manager, source_connector)
 
     with streamer_manager as video_streamer:
-        metron_globals.event_loop.run_until_complete(video_streamer.gather_tasks())
+        metron_globals.event_loop.run_until_complete(video_streamer.run())
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 """
 The module provides *Structured Config Schema* to validate Hydra configs - config parameters and their type.
 It does not validate parameter values.
+
+Schema classes are plain dataclasses without `__slots__`. Hydra never instantiates them, it only reads their fields to
+build OmegaConf nodes, and `dataclass(slots=True)` is not available in supported Python versions.
 """
 
 
@@ -27,11 +30,13 @@ class FileSourceSchema(SourceConnectorSchema):
         file_path (str): The same meaning as in FileConnector class. Has to be specified by user.
         transcoding_resolution (typing.List[int]): The same meaning as in FileConnector class.
             Has to be specified by user.
+        use_gpu_transcode (bool): The same meaning as in FileConnector class.
         _target_ (str): Path to *File Connector* class, which is used for automatic Hydra class instantiating.
     """
 
     file_path: str
     transcoding_resolution: typing.List[int]
+    use_gpu_transcode: bool = False
     _target_: str = "metron_conduit.source_connector.file_source.FileConnector"
 
 
@@ -55,6 +60,7 @@ class UsbCamSourceSchema(SourceConnectorSchema):
         cam_focus (typing.Optional[int]): The same meaning as in UsbCamConnector class.
         cam_autofocus (typing.Optional[int]): The same meaning as in UsbCamConnector class.
         cam_auto_wb (typing.Optional[int]): The same meaning as in UsbCamConnector class.
+        grabber_cpu_core (typing.Optional[int]): The same meaning as in UsbCamConnector class.
         _target_ (str): Path to *USB Camera Connector* class, which is used for automatic Hydra class instantiating.
     """
 
@@ -73,6 +79,7 @@ class UsbCamSourceSchema(SourceConnectorSchema):
     cam_focus: typing.Optional[int] = None
     cam_autofocus: typing.Optional[int] = None
     cam_auto_wb: typing.Optional[int] = None
+    grabber_cpu_core: typing.Optional[int] = None
     _target_: str = "metron_conduit.source_connector.usb_cam_source.UsbCamConnector"
 
 
@@ -90,15 +97,26 @@ class StreamerWorkerSchema:
         com_pattern (typing.Optional[int]): The same meaning as in StreamerWorker class.
         stream_frame_res (typing.List[int]): The same meaning as in StreamerWorker class.
         stream_fps (float): The same meaning as in StreamerWorker class.
+        zmq_sndhwm (int): The same meaning as in StreamerWorker class.
+        zmq_conflate (bool): The same meaning as in StreamerWorker class.
+        stream_pixel_format (str): The same meaning as in StreamerWorker class.
+        stream_quality (int): The same meaning as in StreamerWorker class.
         _target_ (str): Path to *Video Streamer* class, which is used for automatic Hydra class instantiating.
     """
 
+    # pylint: disable=too-many-instance-attributes
+    # Addressing the same topic as exception in *Streamer Worker* class, schema mirrors its flat parameters.
+
     address: str
     port: str
     com_protocol: str
     com_pattern: int
     stream_frame_res: typing.List[int]
     stream_fps: float
+    zmq_sndhwm: int = 32
+    zmq_conflate: bool = True
+    stream_pixel_format: str = "bgr"
+    stream_quality: int = 85
     _target_: str = "metron_conduit.video_streamer.streamer_worker.StreamerWorker"
 
 
@@ -125,10 +143,13 @@ class MetronConduitConfigSchema:
 
     Attributes:
         source_connector (SourceConnectorSchema):  Particular *Source Connector*.
+        cpu_affinity (typing.Optional[typing.List[int]]): CPU cores which *Metron Conduit* process is pinned to. If
+            `None`, process is scheduled on all cores.
     """
 
     video_streamer: VideoStreamerSchema
     source_connector: SourceConnectorSchema
+    cpu_affinity: typing.Optional[typing.List[int]] = None
 
 
 def metron_conduit_config_schema_registration(cf_instance: ConfigStore) -> None:
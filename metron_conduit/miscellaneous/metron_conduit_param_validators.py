@@ -13,6 +13,39 @@ from shared import param_validators as shared_param_val
 _CV_CAP_OPTION_LOWER_BOUND: typing.Final[int] = 0
 _CV_CAP_OPTION_UPPER_BOUND: typing.Final[int] = 100
 _CAM_FPS_DIFF_EPS: typing.Final[float] = 1e-1
+_MEDIA_INFO_PARSE_SPEED: typing.Final[float] = 0.0
+# opened camera devices shared across camera checks, opening of a device is expensive
+_CAM_CAPTURES: typing.Final[typing.Dict[int, cv.VideoCapture]] = {}
+
+
+def _get_cam_capture(camera_id: int) -> cv.VideoCapture:
+    """
+    Returns opened camera device given by <camera_id>. The device is opened only once and reused by following
+    checks, until <release_validation_caches()> is called.
+
+    Args:
+        camera_id (int): Camera id.
+
+    Returns (cv.VideoCapture): Camera device.
+    """
+    cap = _CAM_CAPTURES.get(camera_id)
+    if cap is None:
+        cap = cv.VideoCapture(camera_id)
+        _CAM_CAPTURES[camera_id] = cap
+
+    return cap
+
+
+def release_validation_caches() -> None:
+    """
+    Releases all camera devices opened by camera checks. It has to be called when checks are done, before the camera
+    is opened for streaming.
+
+    Returns (None):
+    """
+    for cap in _CAM_CAPTURES.values():
+        cap.release()
+    _CAM_CAPTURES.clear()
 
 
 def cam_device_existence_check(camera_id: int) -> None:
@@ -29,7 +62,7 @@ def cam_device_existence_check(camera_id: int) -> None:
     """
     shared_param_val.type_check(camera_id, int)
 
-    cap = cv.VideoCapture(camera_id)
+    cap = _get_cam_capture(camera_id)
     if cap is None or not cap.isOpened():
         raise custom_exception.IOCamDevError(accessed_cam_id=camera_id)
 
@@ -51,7 +84,7 @@ def cam_resolution_support_check(camera_id: int, resolution: typing.Tuple[int, i
     shared_param_val.type_check(resolution[0], int)
     shared_param_val.type_check(resolution[1], int)
 
-    cap = cv.VideoCapture(camera_id)
+    cap = _get_cam_capture(camera_id)
     cap.set(cv.CAP_PROP_FRAME_WIDTH, resolution[0])
     cap.set(cv.CAP_PROP_FRAME_HEIGHT, resolution[1])
     set_width = cap.get(cv.CAP_PROP_FRAME_WIDTH)
@@ -83,7 +116,7 @@ def cam_fps_support_check(camera_id: int, fps: int) -> None:
     if fps <= 0 or fps > 60:
         raise ValueError(f"Given FPS `{fps}` is out of FPS reasonable range: (0, 60>.")
 
-    cap = cv.VideoCapture(camera_id)
+    cap = _get_cam_capture(camera_id)
     cap.set(cv.CAP_PROP_FPS, fps)
     set_fps = cap.get(cv.CAP_PROP_FPS)
     if abs(set_fps - fps) > _CAM_FPS_DIFF_EPS:
@@ -106,8 +139,10 @@ def cam_control_support_check(
         control_option_label (str): String label of camera control option for error logging purpose.
         cam_cap_attribute (int): OpenCV camera control attribute id.
         value (int): Camera control attribute value.
-        cam_option_lower_bound (int): Lower bound for camera option validation.
-        cam_option_upper_bound (int): Upper bound for camera option validation.
+        cam_option_lower_bound (typing.Optional[int]): Lower bound for camera option validation. If `None`, default
+            OpenCV lower bound is used.
+        cam_option_upper_bound (typing.Optional[int]): Upper bound for camera option validation. If `None`, default
+            OpenCV upper bound is used.
 
     Returns (None):
 
@@ -125,8 +160,10 @@ def cam_control_support_check(
     shared_param_val.type_check(cam_option_lower_bound, (int, type(None)))
     shared_param_val.type_check(cam_option_upper_bound, (int, type(None)))
 
-    cam_option_lower_bound = cam_option_lower_bound or _CV_CAP_OPTION_LOWER_BOUND
-    cam_option_upper_bound = cam_option_upper_bound or _CV_CAP_OPTION_UPPER_BOUND
+    if cam_option_lower_bound is None:
+        cam_option_lower_bound = _CV_CAP_OPTION_LOWER_BOUND
+    if cam_option_upper_bound is None:
+        cam_option_upper_bound = _CV_CAP_OPTION_UPPER_BOUND
 
     try:
         shared_param_val.parameter_value_in_range(value, cam_option_lower_bound, cam_option_upper_bound)
@@ -136,7 +173,7 @@ def cam_control_support_check(
             f" <{cam_option_lower_bound}, {cam_option_upper_bound}>"
         ) from value_error
 
-    cap = cv.VideoCapture(camera_id)
+    cap = _get_cam_capture(camera_id)
     cap.set(cam_cap_attribute, value)
     set_attribute = cap.get(cam_cap_attribute)
     if set_attribute != value:
@@ -160,7 +197,8 @@ def video_file_check(file_path: str) -> None:
     """
     shared_param_val.type_check(file_path, str)
 
-    media_info = MediaInfo.parse(file_path)
+    # only container headers are parsed, the file is not scanned to refine stream statistics
+    media_info = MediaInfo.parse(file_path, parse_speed=_MEDIA_INFO_PARSE_SPEED)
 
     video_tracks = media_info.video_tracks
     if len(video_tracks) == 0:
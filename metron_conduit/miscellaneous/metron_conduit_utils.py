@@ -2,7 +2,11 @@
 This file contains small domain-free functions specific to *Metron Conduit*.
 """
 
+import os
+import functools
+import typing
 import hydra
+from omegaconf import OmegaConf
 from metron_conduit.miscellaneous.metron_conduit_config_schema import MetronConduitConfigSchema
 from metron_conduit.video_streamer.streamer_manager import StreamerManager
 from metron_conduit.video_streamer.streamer_worker import StreamerWorker
@@ -10,6 +14,53 @@ from metron_conduit.source_connector.abstract_source import AbstractConnector
 from shared.config import GetHydraConfig
 
 
+@functools.lru_cache(maxsize=None)
+def _get_target_class(target: str) -> typing.Type[typing.Any]:
+    """
+    Resolves class given by Hydra's `_target_` path. Resolved classes are cached, so import and attribute lookup
+    is done only once per class.
+
+    Args:
+        target (str): Full path to the class.
+
+    Returns (typing.Type[typing.Any]): Resolved class.
+    """
+    return hydra.utils.get_class(target)
+
+
+@GetHydraConfig
+def set_cpu_affinity(hydra_config: MetronConduitConfigSchema) -> None:
+    """
+    Pins *Metron Conduit* process to CPU cores given by Hydra's configuration. Threads started afterwards, like
+    decoding threads of *Source Connectors*, inherit the affinity. Keeping the event loop and decoding threads on
+    the same cores (ideally on NIC's NUMA node) avoids migrations and cross-node memory traffic. Affinity is set only
+    on platforms which support it.
+
+    Args:
+        hydra_config (MetronConduitConfigSchema): Metron Conduit configuration parameters provided by Hydra's config.
+
+    Returns (None):
+
+    Exceptions:
+        ValueError: If `cpu_affinity` YAML config parameter is empty or contains unavailable CPU core.
+    """
+    # mypy [attr-defined] is ignored because <hydra_config> is a duck type object
+    cpu_affinity = hydra_config.cpu_affinity  # type: ignore[attr-defined]
+    if cpu_affinity is None or not hasattr(os, "sched_setaffinity"):
+        return
+
+    cpu_cores = set(cpu_affinity)
+    if len(cpu_cores) == 0:
+        raise ValueError("Given `cpu_affinity` YAML config parameter is empty.")
+    available_cpu_cores = os.sched_getaffinity(0)
+    if not cpu_cores.issubset(available_cpu_cores):
+        raise ValueError(
+            f"Given `cpu_affinity` YAML config parameter value `{list(cpu_affinity)}` contains unavailable CPU cores. "
+            f"Available CPU cores: {sorted(available_cpu_cores)}"
+        )
+    os.sched_setaffinity(0, cpu_cores)
+
+
 @GetHydraConfig
 def instantiate_source_connector(hydra_config: MetronConduitConfigSchema) -> AbstractConnector:
     """
@@ -37,12 +88,22 @@ def setup_streamer_workers(
         source_connector (AbstractConnector): *Source Connector* instance which is used for async frames generator.
 
     Returns (None):
+
+    Exceptions:
+        ValueError: If *Streamer Worker* YAML config parameter is not a config node.
     """
     # mypy [attr-defined] is ignored because <hydra_config> is a duck type object
     for streamer_worker_name in hydra_config.video_streamer:  # type: ignore[attr-defined]
-        instantiated_streamer_worker: StreamerWorker = hydra.utils.instantiate(
+        # all workers share the same class, so it is resolved once and workers are constructed directly from plain
+        # parameters instead of repeated Hydra instantiation
+        streamer_worker_params = OmegaConf.to_container(
             # mypy [index] is ignored because <hydra_config> is a duck type object
-            hydra_config.video_streamer[streamer_worker_name]  # type: ignore[index]
+            hydra_config.video_streamer[streamer_worker_name],  # type: ignore[index]
+            resolve=True,
         )
+        if not isinstance(streamer_worker_params, dict):
+            raise ValueError(f"`video_streamer.{streamer_worker_name}` YAML config parameter has to be a config node.")
+        streamer_worker_class = _get_target_class(streamer_worker_params.pop("_target_"))
+        instantiated_streamer_worker: StreamerWorker = streamer_worker_class(**streamer_worker_params)
         instantiated_streamer_worker.set_frame_generator(source_connector)
         streamer_manager.register_streamer_worker(instantiated_streamer_worker)
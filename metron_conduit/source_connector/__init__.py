@@ -17,8 +17,12 @@ all_children = source_connector.AbstractConnector.__subclasses__()
 """
 
 
-import os.path as os_path
-import glob
+import os
 
-modules = glob.glob(os_path.join(os_path.dirname(__file__), "*.py"))
-__all__ = [os_path.basename(f)[:-3] for f in modules if os_path.isfile(f) and not f.endswith("__init__.py")]
+# one directory listing provides also entry types, so no extra `stat` call per file is needed
+with os.scandir(os.path.dirname(__file__)) as package_entries:
+    __all__ = [
+        entry.name[:-3]
+        for entry in package_entries
+        if entry.is_file() and entry.name.endswith(".py") and entry.name != "__init__.py"
+    ]
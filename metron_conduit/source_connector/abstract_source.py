@@ -18,6 +18,8 @@ class AbstractConnector(ABC):
 
     Attributes:
         connector_type (str): String label for given *Source Connector* type.
+        is_live (bool): Source provides frames in real time, like a camera. Frames of live source which are not read
+            in time become stale. Frames of non-live source, like a video file, are read at the streaming pace.
     """
 
     @property
@@ -29,6 +31,15 @@ class AbstractConnector(ABC):
         """
         raise NotImplementedError
 
+    @property
+    def is_live(self) -> bool:
+        """
+        Defines attribute `is_live` using "get" method as not implemented - abstract attribute.
+
+        Returns (bool):
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def __enter__(self) -> AbstractConnector:
         """
@@ -8,6 +8,8 @@ from __future__ import (
     annotations,
 )  # allowing future references -> return class under which return value is returned
 import typing
+import queue
+import threading
 import numpy as np
 from vidgear.gears import VideoGear
 import cv2 as cv
@@ -15,6 +17,22 @@ from shared import param_validators as shared_param_val
 from metron_conduit.miscellaneous import metron_conduit_param_validators as param_val
 from .abstract_source import AbstractConnector
 
+_PREFETCH_QUEUE_SIZE: typing.Final[int] = 8
+# every queued frame has own buffer, plus the frame being trans-coded, the frame being taken by the consumer and
+# the frame being processed. *Streamer Manager* fans frames out to *Streamer Worker* instances, so it takes the next
+# frame while workers still process the previous one. Workers always process the latest taken frame and release it
+# before they give control back to the event loop, so older frames are not in use any more.
+_FRAME_BUFFER_COUNT: typing.Final[int] = _PREFETCH_QUEUE_SIZE + 3
+
+
+def _cuda_transcoding_available() -> bool:
+    """
+    Checks if OpenCV is built with CUDA video decoding support and there is at least one CUDA enabled device.
+
+    Returns (bool): `True` if video file can be decoded and trans-coded on GPU, otherwise `False`.
+    """
+    return hasattr(cv, "cudacodec") and cv.cuda.getCudaEnabledDeviceCount() > 0
+
 
 class FileConnector(AbstractConnector):
     """
@@ -22,17 +40,42 @@ class FileConnector(AbstractConnector):
 
     Attributes:
         connector_type (str): String label for given *Source Connector* type.
+        is_live (bool): Video file is not a live source.
         _file_path (str): Path to the file.
         _transcoding_resolution (typing.Tuple[int, int]): Input video file is trans-coded into the given resolution
             before it is streamed. Tuple representation is (transcoding_resolution_width,
             transcoding_resolution_height).
-        _video_gear (vidgear.gears.VideoGear): Object holding a connection to the video file and
-            able capture stream frames.
+        _use_cuda (bool): Video file is decoded and trans-coded on GPU. Only trans-coded frame is downloaded into
+            host memory.
+        _video_gear (typing.Optional[vidgear.gears.VideoGear]): Object holding a connection to the video file and
+            able capture stream frames. It is `None` if <_use_cuda> is `True`.
+        _cuda_reader (typing.Optional[cv.cudacodec_VideoReader]): GPU video file reader. It is `None` if <_use_cuda>
+            is `False`.
+        _cuda_stream (typing.Optional[cv.cuda_Stream]): CUDA stream on which trans-coding operations are queued.
+        _gpu_src_frame (typing.Optional[cv.cuda_GpuMat]): Persistent GPU buffer for decoded frame in source
+            resolution.
+        _gpu_resized_frame (typing.Optional[cv.cuda_GpuMat]): Persistent GPU buffer for resized BGRA frame.
+        _gpu_bgr_frame (typing.Optional[cv.cuda_GpuMat]): Persistent GPU buffer for resized BGR frame.
+        _frame_buffers (typing.List[np.array]): Preallocated host buffers for trans-coded frames, which are used in
+            rotation.
+        _frame_buffer_idx (int): Index of the next buffer from <_frame_buffers> to be used.
+        _needs_resize (bool): Video file resolution differs from <_transcoding_resolution>. It is determined when
+            entering into context.
+        _interpolation (int): OpenCV interpolation used for resizing. Area interpolation is used for downscaling,
+            linear interpolation for upscaling. It is determined when entering into context.
+        _frame_queue (queue.Queue): Bounded queue of trans-coded frames prefetched by <_prefetch_thread>.
+        _stop_prefetch (threading.Event): Signals <_prefetch_thread> to stop.
+        _prefetch_thread (typing.Optional[threading.Thread]): Thread which decodes and trans-codes frames ahead,
+            so decoding overlaps with streaming. It is started when entering into context.
     """
 
+    # pylint: disable=too-many-instance-attributes
+    # GPU trans-coding and prefetching need persistent buffers and a thread, which are kept as attributes.
+
     connector_type: typing.ClassVar[str] = "video_file"
+    is_live: typing.ClassVar[bool] = False
 
-    def __init__(self, file_path: str, transcoding_resolution: typing.Tuple[int, int]):
+    def __init__(self, file_path: str, transcoding_resolution: typing.Tuple[int, int], use_gpu_transcode: bool = False):
         """
         Stores all attributes needed to connect to the file.
 
@@ -41,26 +84,73 @@ class FileConnector(AbstractConnector):
             transcoding_resolution (typing.Tuple[int, int]): Input video file is trans-coded into the given
                 resolution before it is streamed. Tuple representation is
                 (transcoding_resolution_width, transcoding_resolution_height).
+            use_gpu_transcode (bool): Decode and trans-code video file on GPU, if OpenCV is built with CUDA video
+                decoding support and CUDA enabled device is present. Otherwise CPU is used.
         """
-        shared_param_val.type_check(file_path, str)
-        shared_param_val.type_check(transcoding_resolution[0], int)
-        shared_param_val.type_check(transcoding_resolution[1], int)
+        if __debug__:
+            shared_param_val.type_check(file_path, str)
+            shared_param_val.type_check(transcoding_resolution[0], int)
+            shared_param_val.type_check(transcoding_resolution[1], int)
+            shared_param_val.type_check(use_gpu_transcode, bool)
 
         shared_param_val.file_existence_check(file_path)
         shared_param_val.resolution_validity_check(transcoding_resolution[0], transcoding_resolution[1])
         param_val.video_file_check(file_path)
 
         self._file_path = file_path
-        self._transcoding_resolution = transcoding_resolution
-        self._video_gear = VideoGear(source=self._file_path)
+        self._transcoding_resolution = (transcoding_resolution[0], transcoding_resolution[1])
+        self._use_cuda = use_gpu_transcode and _cuda_transcoding_available()
+        self._video_gear = None
+        self._cuda_reader = None
+        self._cuda_stream = None
+        self._gpu_src_frame = None
+        self._gpu_resized_frame = None
+        self._gpu_bgr_frame = None
+        self._frame_buffer_idx = 0
+        self._needs_resize = True
+        self._interpolation = cv.INTER_LINEAR
+        self._frame_queue: queue.Queue = queue.Queue(maxsize=_PREFETCH_QUEUE_SIZE)
+        self._stop_prefetch = threading.Event()
+        self._prefetch_thread: typing.Optional[threading.Thread] = None
+
+        if self._use_cuda:
+            width, height = self._transcoding_resolution
+            self._cuda_reader = cv.cudacodec.createVideoReader(self._file_path)
+            self._cuda_stream = cv.cuda_Stream()
+            # allocated by the first decoded frame and reused afterwards, because the source resolution is the same
+            self._gpu_src_frame = cv.cuda_GpuMat()
+            self._gpu_resized_frame = cv.cuda_GpuMat(height, width, cv.CV_8UC4)
+            self._gpu_bgr_frame = cv.cuda_GpuMat(height, width, cv.CV_8UC3)
+        else:
+            self._video_gear = VideoGear(source=self._file_path)
+        self._frame_buffers = [
+            np.empty((self._transcoding_resolution[1], self._transcoding_resolution[0], 3), dtype=np.uint8)
+            for _ in range(_FRAME_BUFFER_COUNT)
+        ]
 
     def __enter__(self) -> FileConnector:
         """
-        Context manager __entry__ method. Prepares VideoGear instance for frames reading.
+        Context manager __entry__ method. Prepares VideoGear instance for frames reading, GPU video reader is ready
+        right after instantiation. Starts prefetching of frames.
 
         Returns (file_source.FileConnector): Itself.
         """
-        self._video_gear.start()
+        if self._video_gear is not None:
+            self._video_gear.start()
+            video_capture = self._video_gear.stream.stream
+            src_res = (
+                int(video_capture.get(cv.CAP_PROP_FRAME_WIDTH)),
+                int(video_capture.get(cv.CAP_PROP_FRAME_HEIGHT)),
+            )
+            self._needs_resize = src_res != self._transcoding_resolution
+            is_downscaled = src_res[0] * src_res[1] > self._transcoding_resolution[0] * self._transcoding_resolution[1]
+            self._interpolation = cv.INTER_AREA if is_downscaled else cv.INTER_LINEAR
+
+        # the end of the stream left by previous exit is dropped
+        self._frame_queue = queue.Queue(maxsize=_PREFETCH_QUEUE_SIZE)
+        self._stop_prefetch.clear()
+        self._prefetch_thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self._prefetch_thread.start()
         return self
 
     def __exit__(
@@ -70,7 +160,8 @@ class FileConnector(AbstractConnector):
         exc_tb: typing.Any,
     ) -> None:
         """
-        Context manager __exit__ method. Stops VideoGear instance.
+        Context manager __exit__ method. Stops frames prefetching and VideoGear instance. The end of the stream is
+        signaled to consumers waiting for a frame.
 
         Args:
             exc_type (typing.Optional[Exception]): Exception type.
@@ -79,7 +170,26 @@ class FileConnector(AbstractConnector):
 
         Returns (None):
         """
-        self._video_gear.stop()
+        self._stop_prefetch.set()
+        if self._video_gear is not None:
+            self._video_gear.stop()
+
+        if self._prefetch_thread is not None:
+            # frees the queue, so blocked prefetching thread can notice the stop signal
+            while self._prefetch_thread.is_alive():
+                try:
+                    self._frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self._prefetch_thread = None
+        # wakes up consumers blocked in <get_frame()>, e.g. executor threads of *Streamer Manager*, by the end of
+        # the stream, remaining frames are dropped so the end of the stream fits into the queue
+        while True:
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                break
+        self._frame_queue.put(None)
 
     def get_frame(self) -> typing.Union[np.array]:
         """
@@ -88,11 +198,85 @@ class FileConnector(AbstractConnector):
         Returns (typing.Union[np.array]): 3-dim array representing video frame in the order B, G, R.
             If obtained frame is `None`, which means video file stream is broken or finished, then `None` is returned.
         """
-        frame = self._video_gear.read()
+        frame = self._frame_queue.get()
         if frame is None:
+            # keeps end of the stream visible for following calls
+            self._frame_queue.put(None)
+
+        return frame
+
+    def _decode_loop(self) -> None:
+        """
+        Prefetching thread body. Decodes and trans-codes frames ahead into <_frame_queue> until the video file stream
+        is finished or the stop is signaled.
+
+        Returns (None):
+        """
+        while not self._stop_prefetch.is_set():
+            frame = self._read_transcoded_frame()
+            self._frame_queue.put(frame)
+            if frame is None:
+                break
+
+    def _read_transcoded_frame(self) -> typing.Union[np.array]:
+        """
+        Reads next frame of the video file and trans-codes it.
+
+        Returns (typing.Union[np.array]): 3-dim array representing video frame in the order B, G, R.
+            If obtained frame is `None`, which means video file stream is broken or finished, then `None` is returned.
+        """
+        if self._use_cuda:
+            return self._get_gpu_transcoded_frame()
+
+        # mypy [union-attr] is ignored because <_video_gear> is always set if <_use_cuda> is `False`
+        frame = self._video_gear.read()  # type: ignore[union-attr]
+        if frame is None or not self._needs_resize:
+            return frame
+
+        return cv.resize(
+            frame, dsize=self._transcoding_resolution, dst=self._next_frame_buffer(), interpolation=self._interpolation
+        )
+
+    def _next_frame_buffer(self) -> np.array:
+        """
+        Returns next preallocated frame buffer in rotation. The buffer is not reused until all other buffers are used,
+        so the frame is not overwritten while it is queued or consumed.
+
+        Returns (np.array): Frame buffer.
+        """
+        frame_buffer = self._frame_buffers[self._frame_buffer_idx]
+        self._frame_buffer_idx = (self._frame_buffer_idx + 1) % _FRAME_BUFFER_COUNT
+
+        return frame_buffer
+
+    def _get_gpu_transcoded_frame(self) -> typing.Union[np.array]:
+        """
+        Decodes and resizes next frame on GPU. The frame stays in GPU memory until it is trans-coded, then only
+        the trans-coded frame is downloaded into host buffer.
+
+        Returns (typing.Union[np.array]): 3-dim array representing video frame in the order B, G, R.
+            If obtained frame is `None`, which means video file stream is broken or finished, then `None` is returned.
+        """
+        # mypy [union-attr] is ignored because CUDA reader, stream and GPU buffers are always set if <_use_cuda> is
+        # `True`
+        has_frame, _ = self._cuda_reader.nextFrame(self._gpu_src_frame)  # type: ignore[union-attr]
+        if not has_frame:
             return None
 
-        return cv.resize(frame, dsize=self._transcoding_resolution)
+        # GPU reader outputs BGRA frames, colour conversion is done on already resized frame
+        cv.cuda.resize(
+            self._gpu_src_frame,
+            self._transcoding_resolution,
+            dst=self._gpu_resized_frame,
+            interpolation=cv.INTER_LINEAR,
+            stream=self._cuda_stream,
+        )
+        cv.cuda.cvtColor(self._gpu_resized_frame, cv.COLOR_BGRA2BGR, dst=self._gpu_bgr_frame, stream=self._cuda_stream)
+        host_frame = self._next_frame_buffer()
+        self._gpu_bgr_frame.download(self._cuda_stream, host_frame)  # type: ignore[union-attr]
+        self._cuda_stream.waitForCompletion()  # type: ignore[union-attr]
+
+        return host_frame
 
     def get_stream_resolution(self) -> typing.Tuple[int, int]:
         """ "
@@ -7,24 +7,43 @@ This file contains `USB Cam Connector` class, with a helper class, which defines
 from __future__ import (
     annotations,
 )  # allowing future references -> return class under which return value is returned
+import os
+import sys
 import typing
-from dataclasses import dataclass
-import json
+import time
+import threading
+from dataclasses import dataclass, fields
 import numpy as np
-from vidgear.gears import VideoGear
 import cv2 as cv
 from metron_conduit.miscellaneous import metron_conduit_param_validators as param_val
 from shared import param_validators as shared_param_val
+from shared import custom_exception
 from .abstract_source import AbstractConnector
 
 _TIME_DELAY_VALID_UPPER_BOUND: typing.Final[int] = 2 * 60  # in seconds
+_GRABBER_SCHED_PRIORITY: typing.Final[int] = 20  # real-time FIFO priority of pinned grabbing thread
+# camera control option validation setup - label, OpenCV capture property, lower bound and upper bound of the value,
+# `None` bound means OpenCV default bound
+_CamControlCheck = typing.Tuple[str, int, typing.Optional[int], typing.Optional[int]]
+# the order corresponds to camera control arguments of <UsbCamConnector>
+_CAM_CONTROL_CHECKS: typing.Final[typing.Tuple[_CamControlCheck, ...]] = (
+    ("brightness", cv.CAP_PROP_BRIGHTNESS, None, None),
+    ("contrast", cv.CAP_PROP_CONTRAST, None, None),
+    ("saturation", cv.CAP_PROP_SATURATION, None, None),
+    ("hue", cv.CAP_PROP_HUE, None, None),
+    ("zoom", cv.CAP_PROP_ZOOM, -100, 100),
+    ("focus", cv.CAP_PROP_FOCUS, 0, 255),
+    ("autofocus", cv.CAP_PROP_AUTOFOCUS, 0, 1),
+    ("auto white balance", cv.CAP_PROP_AUTO_WB, 0, 1),
+)
 
 
-@dataclass
+@dataclass(frozen=True)
 class _CamOptions:
     """
-    Defines camera options used by underlying OpenCV VideoCapture API which is called by CamGear in `USB Cam Connector`.
-    Attribute names correspond to OpenCV VideoCapture API options, except lowercase.
+    Defines camera options used by underlying OpenCV VideoCapture API in `USB Cam Connector`.
+    Attribute names correspond to OpenCV VideoCapture API options, except lowercase. Options are immutable once
+    the camera connector is created.
 
     Attributes:
         cap_prop_frame_width (int): Camera frame width. Could be lower than native camera resolution.
@@ -38,6 +57,8 @@ class _CamOptions:
         cap_prop_focus (int): Camera focus level. Currently is not supported on MacOS.
         cap_prop_autofocus (int): Enable or disable camera autofocus. Currently is not supported on MacOS.
         cap_prop_auto_wb (int): Camera auto white balancing level. Currently is not supported on MacOS.
+        cap_prop_buffersize (int): Number of frames buffered by the camera driver. Default value `1` keeps only
+            the latest frame, so stale buffered frames do not add latency. Ignored by drivers which do not support it.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -54,18 +75,36 @@ class _CamOptions:
     cap_prop_focus: typing.Optional[int]
     cap_prop_autofocus: typing.Optional[int]
     cap_prop_auto_wb: typing.Optional[int]
+    cap_prop_buffersize: int = 1
 
     def get_kw_options(self) -> dict:
         """
-        Converts options as class attributes into JSON with uppercase for keys. This is
-        required by VidGear which consumes the dictionary. If option value is equal None, then the option is discarded
-        from output key-worded JSON, because camera default value should be used for the option.
+        Converts options as class attributes into dictionary with uppercase for keys. Keys correspond to OpenCV
+        VideoCapture property names. If option value is equal None, then the option is discarded
+        from output key-worded dictionary, because camera default value should be used for the option.
 
         Returns (dict): Instance attributes converted into dictionary with uppercase for keys.
         """
-        kw_options = json.loads(json.dumps(self.__dict__))
-        kw_options_uppercase = {key.upper(): value for key, value in kw_options.items() if value is not None}
-        return kw_options_uppercase
+        return {
+            option.name.upper(): value for option in fields(self) if (value := getattr(self, option.name)) is not None
+        }
+
+
+def _validate_cam_controls(camera_id: int, cam_control_values: typing.Tuple[typing.Optional[int], ...]) -> None:
+    """
+    Checks that given camera control options are supported by the camera and their values are in valid range.
+    Options with `None` value are skipped, because camera default value is used for them.
+
+    Args:
+        camera_id (int): Camera device id.
+        cam_control_values (typing.Tuple[typing.Optional[int], ...]): Camera control option values in the order of
+            <_CAM_CONTROL_CHECKS>.
+
+    Returns (None):
+    """
+    for (label, cam_cap_attribute, lower_bound, upper_bound), value in zip(_CAM_CONTROL_CHECKS, cam_control_values):
+        if value is not None:
+            param_val.cam_control_support_check(camera_id, label, cam_cap_attribute, value, lower_bound, upper_bound)
 
 
 class UsbCamConnector(AbstractConnector):
@@ -74,16 +113,28 @@ class UsbCamConnector(AbstractConnector):
 
     Attributes:
         connector_type (str): String label for given `Source Connector` type.
+        is_live (bool): USB cam is a live source.
         _camera_id (int): Camera id.
         _time_delay (int): Time delay in seconds, before camera starts to stream. Default value is `0`.
-        _camera_option (usb_cam_source._CamOptions): Camera options setup used by underlying OpenCV VideoCapture API
-            in NetGear.
-        _video_gear (vidgear.gears.VideoGear): Object holding a connection to the camera and
-            able capturecamera stream. Instantiated VideoGear is assigned when entering into context and
-            on close set to None.
+        _grabber_cpu_core (typing.Optional[int]): CPU core which <_grabber_thread> is pinned to.
+        _camera_option (usb_cam_source._CamOptions): Camera options setup used by underlying OpenCV VideoCapture API.
+        _video_capture (typing.Optional[cv.VideoCapture]): Object holding a connection to the camera. It is opened
+            when entering into context and on close released and set to None.
+        _frame_condition (threading.Condition): Guards the latest frame slot and notifies about new frames.
+        _latest_frame (typing.Optional[np.array]): The latest frame grabbed from the camera.
+        _frame_seq (int): Sequence number of <_latest_frame>. It is increased with every grabbed frame.
+        _stream_finished (bool): Camera stream is broken and no more frames are grabbed.
+        _stop_grabbing (threading.Event): Signals <_grabber_thread> to stop.
+        _grabber_thread (typing.Optional[threading.Thread]): Thread which continuously drains camera driver buffer
+            and keeps only the latest frame, so frames are never read with a delay. It is started when entering into
+            context.
     """
 
+    # pylint: disable=too-many-instance-attributes
+    # The latest frame slot shared with the grabbing thread needs to be kept as attributes.
+
     connector_type: typing.ClassVar[str] = "usb_camera"
+    is_live: typing.ClassVar[bool] = True
 
     def __init__(
         self,
@@ -99,6 +150,7 @@ class UsbCamConnector(AbstractConnector):
         cam_autofocus: typing.Optional[int] = None,
         cam_auto_wb: typing.Optional[int] = None,
         time_delay: int = 0,
+        grabber_cpu_core: typing.Optional[int] = None,
     ):
         """
         Stores all attributes needed to connect to the camera.
@@ -120,50 +172,63 @@ class UsbCamConnector(AbstractConnector):
                 on MacOS.
             time_delay (typing.Optional[int]): Time delay in seconds, before camera starts to stream.
                 Value greater than 0 is beneficial for camera warm-up.
+            grabber_cpu_core (typing.Optional[int]): CPU core which frames grabbing thread is pinned to. Pinned thread
+                also gets real-time FIFO scheduling class, if the process is permitted to set it. Supported only on
+                Linux. If `None`, thread is not pinned.
         """
 
         # pylint: disable=too-many-arguments
         # Most of the arguments are None by default, so not all parameters are needed to specify and encapsulation in
         # more classes would make instantiating process more complicated, because Hydra instantiate feature is used.
 
-        shared_param_val.type_check(camera_id, int)
-        shared_param_val.type_check(cam_frame_res[0], int)
-        shared_param_val.type_check(cam_frame_res[1], int)
-        shared_param_val.type_check(cam_fps, int)
-        shared_param_val.type_check(cam_brightness, (int, type(None)))
-        shared_param_val.type_check(cam_contrast, (int, type(None)))
-        shared_param_val.type_check(cam_saturation, (int, type(None)))
-        shared_param_val.type_check(cam_hue, (int, type(None)))
-        shared_param_val.type_check(cam_zoom, (int, type(None)))
-        shared_param_val.type_check(cam_focus, (int, type(None)))
-        shared_param_val.type_check(cam_autofocus, (int, type(None)))
-        shared_param_val.type_check(cam_auto_wb, (int, type(None)))
-        shared_param_val.type_check(time_delay, int)
-
-        param_val.cam_device_existence_check(camera_id)
-        shared_param_val.resolution_validity_check(cam_frame_res[0], cam_frame_res[1])
-        param_val.cam_resolution_support_check(camera_id, cam_frame_res)
-        param_val.cam_fps_support_check(camera_id, cam_fps)
-        if cam_brightness is not None:
-            param_val.cam_control_support_check(camera_id, "brightness", cv.CAP_PROP_BRIGHTNESS, cam_brightness)
-        if cam_contrast is not None:
-            param_val.cam_control_support_check(camera_id, "contrast", cv.CAP_PROP_CONTRAST, cam_contrast)
-        if cam_saturation is not None:
-            param_val.cam_control_support_check(camera_id, "saturation", cv.CAP_PROP_SATURATION, cam_saturation)
-        if cam_hue is not None:
-            param_val.cam_control_support_check(camera_id, "hue", cv.CAP_PROP_HUE, cam_hue)
-        if cam_zoom is not None:
-            param_val.cam_control_support_check(camera_id, "zoom", cv.CAP_PROP_ZOOM, cam_zoom, -100, 100)
-        if cam_focus is not None:
-            param_val.cam_control_support_check(camera_id, "focus", cv.CAP_PROP_FOCUS, cam_focus, 0, 255)
-        if cam_autofocus is not None:
-            param_val.cam_control_support_check(camera_id, "autofocus", cv.CAP_PROP_AUTOFOCUS, cam_autofocus, 0, 1)
-        if cam_auto_wb is not None:
-            param_val.cam_control_support_check(camera_id, "auto white balance", cv.CAP_PROP_AUTO_WB, cam_auto_wb, 0, 1)
-        shared_param_val.parameter_value_in_range(time_delay, 0, _TIME_DELAY_VALID_UPPER_BOUND)
+        if __debug__:
+            shared_param_val.type_check(camera_id, int)
+            shared_param_val.type_check(cam_frame_res[0], int)
+            shared_param_val.type_check(cam_frame_res[1], int)
+            shared_param_val.type_check(cam_fps, int)
+            shared_param_val.type_check(cam_brightness, (int, type(None)))
+            shared_param_val.type_check(cam_contrast, (int, type(None)))
+            shared_param_val.type_check(cam_saturation, (int, type(None)))
+            shared_param_val.type_check(cam_hue, (int, type(None)))
+            shared_param_val.type_check(cam_zoom, (int, type(None)))
+            shared_param_val.type_check(cam_focus, (int, type(None)))
+            shared_param_val.type_check(cam_autofocus, (int, type(None)))
+            shared_param_val.type_check(cam_auto_wb, (int, type(None)))
+            shared_param_val.type_check(time_delay, int)
+            shared_param_val.type_check(grabber_cpu_core, (int, type(None)))
+
+        try:
+            param_val.cam_device_existence_check(camera_id)
+            shared_param_val.resolution_validity_check(cam_frame_res[0], cam_frame_res[1])
+            param_val.cam_resolution_support_check(camera_id, cam_frame_res)
+            param_val.cam_fps_support_check(camera_id, cam_fps)
+            _validate_cam_controls(
+                camera_id,
+                (
+                    cam_brightness,
+                    cam_contrast,
+                    cam_saturation,
+                    cam_hue,
+                    cam_zoom,
+                    cam_focus,
+                    cam_autofocus,
+                    cam_auto_wb,
+                ),
+            )
+            shared_param_val.parameter_value_in_range(time_delay, 0, _TIME_DELAY_VALID_UPPER_BOUND)
+            if (
+                grabber_cpu_core is not None
+                and hasattr(os, "sched_getaffinity")
+                and grabber_cpu_core not in os.sched_getaffinity(0)
+            ):
+                raise ValueError(f"Given <grabber_cpu_core> value `{grabber_cpu_core}` is not available CPU core.")
+        finally:
+            # camera has to be released before it is opened for streaming
+            param_val.release_validation_caches()
 
         self._camera_id = camera_id
         self._time_delay = time_delay
+        self._grabber_cpu_core = grabber_cpu_core
         self._camera_option = _CamOptions(
             cap_prop_frame_width=cam_frame_res[0],
             cap_prop_frame_height=cam_frame_res[1],
@@ -177,17 +242,39 @@ class UsbCamConnector(AbstractConnector):
             cap_prop_autofocus=cam_autofocus,
             cap_prop_auto_wb=cam_auto_wb,
         )
-        self._video_gear = VideoGear(
-            source=self._camera_id, time_delay=self._time_delay, **self._camera_option.get_kw_options()
-        )
+        self._video_capture: typing.Optional[cv.VideoCapture] = None
+        self._frame_condition = threading.Condition()
+        self._latest_frame: typing.Optional[np.array] = None
+        self._frame_seq = 0
+        self._stream_finished = False
+        self._stop_grabbing = threading.Event()
+        self._grabber_thread: typing.Optional[threading.Thread] = None
 
     def __enter__(self) -> UsbCamConnector:
         """
-        Context manager __entry__ method. Prepares VideoGear instance for frames reading.
+        Context manager __entry__ method. Opens the camera, applies camera options and starts frames grabbing.
 
         Returns (usb_cam_source.UsbCamConnector): Itself.
+
+        Exceptions:
+            IOCamDevError: If camera can not be opened.
         """
-        self._video_gear.start()
+        video_capture = cv.VideoCapture(self._camera_id)
+        if not video_capture.isOpened():
+            video_capture.release()
+            raise custom_exception.IOCamDevError(accessed_cam_id=self._camera_id)
+        for option_name, option_value in self._camera_option.get_kw_options().items():
+            video_capture.set(getattr(cv, option_name), option_value)
+        self._video_capture = video_capture
+        if self._time_delay > 0:
+            time.sleep(self._time_delay)
+
+        self._latest_frame = None
+        self._frame_seq = 0
+        self._stream_finished = False
+        self._stop_grabbing.clear()
+        self._grabber_thread = threading.Thread(target=self._grab_loop, args=(video_capture,), daemon=True)
+        self._grabber_thread.start()
         return self
 
     def __exit__(
@@ -197,7 +284,7 @@ class UsbCamConnector(AbstractConnector):
         exc_tb: typing.Any,
     ) -> None:
         """
-        Context manager __exit__ method. Stops VideoGear instance and clears the attribute.
+        Context manager __exit__ method. Stops frames grabbing and releases the camera.
 
         Args:
             exc_type (typing.Optional[Exception]): Exception type.
@@ -206,18 +293,91 @@ class UsbCamConnector(AbstractConnector):
 
         Returns (None):
         """
-        self._video_gear.stop()
+        self._stop_grabbing.set()
+        if self._grabber_thread is not None:
+            self._grabber_thread.join()
+            self._grabber_thread = None
+        # wakes up consumers waiting for the next frame
+        with self._frame_condition:
+            self._stream_finished = True
+            self._frame_condition.notify_all()
+        if self._video_capture is not None:
+            self._video_capture.release()
+            self._video_capture = None
 
     def get_frame(self) -> typing.Union[np.array]:
         """
-        Returns next frame of the video source.
+        Returns next frame of the video source. It waits until the camera provides a frame newer than the latest
+        frame at the time of the call, so more consumers get every frame and no frame is returned twice to
+        the same consumer. Use <poll_frame()> for non-waiting access.
 
         Returns (typing.Union[np.array]): 3-dim array representing video frame in the order B, G, R.
-            If camera stream is broken and obtained frame is `None`, then `None` is returned.
+            If camera stream is broken or stopped, then `None` is returned.
+        """
+        with self._frame_condition:
+            last_frame_seq = self._frame_seq
+            self._frame_condition.wait_for(lambda: self._frame_seq != last_frame_seq or self._stream_finished)
+            return None if self._stream_finished else self._latest_frame
+
+    def poll_frame(self, last_frame_seq: int) -> typing.Optional[typing.Tuple[int, typing.Optional[np.array]]]:
+        """
+        Returns the latest frame of the video source, if it is newer than the frame given by its sequence number.
+        It never waits, so consumer can skip processing if there is no new frame.
+
+        Args:
+            last_frame_seq (int): Sequence number of the last frame obtained by consumer. Use `0` for the first call.
+
+        Returns (typing.Optional[typing.Tuple[int, typing.Optional[np.array]]]): Tuple of the latest frame sequence
+            number and the frame. The frame is `None` if camera stream is broken. If there is no newer frame, `None` is
+            returned.
+        """
+        with self._frame_condition:
+            if self._frame_seq == last_frame_seq:
+                return None
+            return self._frame_seq, self._latest_frame
+
+    def _set_grabber_scheduling(self) -> None:
+        """
+        Pins the calling grabbing thread to <_grabber_cpu_core> and elevates its scheduling class to real-time FIFO,
+        so the thread is not preempted by other threads and camera driver buffer does not fill up with stale frames.
+        Setup which is not supported by a platform or not permitted (FIFO requires `CAP_SYS_NICE` capability) is
+        skipped.
+
+        Returns (None):
         """
-        frame = self._video_gear.read()
+        if self._grabber_cpu_core is None:
+            return
+        # scheduling API is available only on Linux, the standalone platform check is understood by static type checkers
+        if not sys.platform.startswith("linux"):
+            return
 
-        return frame
+        try:
+            # pid `0` refers to the calling thread on Linux
+            os.sched_setaffinity(0, {self._grabber_cpu_core})
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_GRABBER_SCHED_PRIORITY))
+        except OSError:
+            pass
+
+    def _grab_loop(self, video_capture: cv.VideoCapture) -> None:
+        """
+        Grabbing thread body. Reads frames as soon as camera provides them and keeps only the latest one, until
+        the camera stream is broken or the stop is signaled.
+
+        Args:
+            video_capture (cv.VideoCapture): Opened camera capture.
+
+        Returns (None):
+        """
+        self._set_grabber_scheduling()
+        while not self._stop_grabbing.is_set():
+            has_frame, frame = video_capture.read()
+            with self._frame_condition:
+                self._latest_frame = frame if has_frame else None
+                self._frame_seq += 1
+                self._stream_finished = not has_frame
+                self._frame_condition.notify_all()
+            if not has_frame:
+                break
 
     def get_stream_resolution(self) -> typing.Tuple[int, int]:
         """ "
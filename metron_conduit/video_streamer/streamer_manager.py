@@ -10,13 +10,15 @@ import asyncio
 from metron_conduit.video_streamer.streamer_worker import StreamerWorker
 from metron_conduit.source_connector.abstract_source import AbstractConnector
 from shared import param_validators as shared_param_val
+from shared import metron_globals
 
 
 class StreamerManager:
     """
     *Streamer Manager* acts like orchestrator of *Streamer Worker* instances, which are registered to it. This allows
     to broadcast the same stream with various configurations. The class communicates with *Source Connector* and
-    passes frame by frame to registered *Streamer Worker* instances.
+    passes frame by frame to registered *Streamer Worker* instances. Every frame is read from *Source Connector* only
+    once and it is put into frame slots of all registered *Streamer Worker* instances.
 
     Attributes:
         _streamer_workers (typing.List[streamer_worker.StreamerWorker]): Registered *Stream Worker* instances which
@@ -35,7 +37,8 @@ class StreamerManager:
                 `Abstract Connector`. All registered `Streamer Worker` instances in <StreamerManager._streamer_workers>
                 broadcast this stream.
         """
-        shared_param_val.type_check(source_connector, AbstractConnector)
+        if __debug__:
+            shared_param_val.type_check(source_connector, AbstractConnector)
 
         self._streamer_workers: typing.List[StreamerWorker] = []
         self._source_connector = source_connector
@@ -51,7 +54,8 @@ class StreamerManager:
 
         Returns (None):
         """
-        shared_param_val.type_check(stream_worker, StreamerWorker)
+        if __debug__:
+            shared_param_val.type_check(stream_worker, StreamerWorker)
 
         self._streamer_workers.append(stream_worker)
 
@@ -90,14 +94,58 @@ class StreamerManager:
 
         self._source_connector.__exit__(exc_type, exc_val, exc_tb)
 
-    def gather_tasks(self) -> asyncio.Future:
+    async def run(self) -> None:
         """
-        Gathers tasks of all registered *Streamer Worker* instances and creates asyncio.Future.
+        Runs tasks of all registered *Streamer Worker* instances and frames producer until all of them finish. If any
+        task fails, the remaining tasks are cancelled right away and the exception is re-raised, so a failing worker
+        does not keep the others streaming and clean-up is not delayed.
 
-        Returns (asyncio.Future): Gathered *Streamer Worker* instance tasks.
+        Returns (None):
         """
-        tasks = []
-        for streamer_worker in self._streamer_workers:
-            tasks.append(streamer_worker.get_streaming_task())
+        tasks = [streamer_worker.get_streaming_task() for streamer_worker in self._streamer_workers]
+        if len(tasks) == 0:
+            return
+        tasks.append(metron_globals.event_loop.create_task(self._produce_frames()))
+
+        done_tasks, pending_tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for pending_task in pending_tasks:
+            pending_task.cancel()
+        if len(pending_tasks) > 0:
+            await asyncio.wait(pending_tasks)
+
+        for done_task in done_tasks:
+            if not done_task.cancelled() and done_task.exception() is not None:
+                raise typing.cast(BaseException, done_task.exception())
+
+    async def _produce_frames(self) -> None:
+        """
+        Reads frames from *Source Connector* and puts every frame into frame slots of all registered *Streamer Worker*
+        instances. Live source is read at its own pace. Other sources are read at the pace of the fastest registered
+        *Streamer Worker*. Reading is done out of the event loop, because it blocks until the frame is ready. The end of
+        the stream (`None` frame) is passed to all *Streamer Worker* instances too.
 
-        return asyncio.gather(*tasks)
+        Returns (None):
+        """
+        loop = metron_globals.event_loop
+        get_frame = self._source_connector.get_frame
+        frame_slots = [streamer_worker.get_frame_slot() for streamer_worker in self._streamer_workers]
+        is_paced = not self._source_connector.is_live
+        frame_latency = 1.0 / max(streamer_worker.get_stream_fps() for streamer_worker in self._streamer_workers)
+        next_frame_time = loop.time()
+
+        while True:
+            # the next frame is read while *Streamer Worker* instances process the previous one, source connectors
+            # with reused frame buffers have to keep one spare buffer for that
+            frame = await loop.run_in_executor(None, get_frame)
+            for frame_slot in frame_slots:
+                frame_slot.put(frame)
+            if frame is None:
+                break
+
+            if is_paced:
+                next_frame_time += frame_latency
+                frame_delay = next_frame_time - loop.time()
+                if frame_delay > 0:
+                    await asyncio.sleep(frame_delay)
+                elif frame_delay < -frame_latency:
+                    next_frame_time = loop.time()
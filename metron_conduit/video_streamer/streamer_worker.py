@@ -10,12 +10,18 @@ from __future__ import (
 import typing
 import logging
 import asyncio
+import itertools
 import cv2 as cv
 import numpy as np
+import zmq
 from vidgear.gears.asyncio import NetGear_Async
 from metron_conduit.source_connector.abstract_source import AbstractConnector
 from shared import param_validators as shared_param_val
 from shared import metron_globals
+from shared.structures import LatestSlot
+
+# output frame buffers are used in rotation, so the yielded frame stays intact while the next frame is processed
+_OUTPUT_BUFFER_COUNT: typing.Final[int] = 2
 
 
 class StreamerWorker:
@@ -32,13 +38,21 @@ class StreamerWorker:
                 FPS is translated into stream frame latency is seconds.
         _stream_frame_res (Tuple[int, int]): Stream frame resolution. Could be lower or higher than native input
                 resolution. Tuple representation is (frame_resolution_width, frame_resolution_height).
+        _zmq_sndhwm (int): ZeroMQ high water mark of outgoing messages. Value `0` means no limit. NetGear overrides
+            it with `1` for communication pattern `2`.
+        _zmq_conflate (bool): Keep only the latest outgoing message in ZeroMQ queue. It is set for every
+            communication pattern, ZeroMQ applies it only for patterns `2` and `3`.
+        _stream_pixel_format (str): Pixel format of streamed frames.
+        _stream_quality (int): JPEG quality of streamed frames. It is used only for `"jpeg"` pixel format.
+        _frame_slot (shared.structures.LatestSlot): Slot with the latest source frame, which is put by
+            *Streamer Manager*. Only the latest frame is streamed, so stale frames are dropped.
         _debug_logging (bool): Activate/deactivate debug logging of NetGear
         _net_gear_streamer (vidgear.gears.asyncio.NetGear_Async): Object responsible for streaming.
             Instantiated NetGear is assigned when entering into context and on close set to None.
     """
 
     # pylint: disable=too-many-instance-attributes
-    # 8/7 attributes is acceptable in this case.
+    # 13/7 attributes is acceptable in this case.
 
     SUPPORTED_COM_PROTOCOLS: typing.Final[typing.List[str]] = ["tcp", "ipc"]
     SUPPORTED_COM_PATTERNS: typing.Final[typing.List[int]] = [
@@ -49,6 +63,13 @@ class StreamerWorker:
     ]  # zmq.PAIRV, zmq.REQ/zmq.REPV, zmq.PUB/zmq.SUB, zmq.PUSH/zmq.PULL
     SUPPORTED_MAX_STREAM_FPS: typing.Final[float] = 60.0
     SUPPORTED_MIN_STREAM_FPS: typing.Final[float] = 1e-2
+    SUPPORTED_STREAM_PIXEL_FORMATS: typing.Final[typing.List[str]] = [
+        "bgr",
+        "yuv420p",
+        "jpeg",
+    ]  # BGR888 (3 bytes per pixel), planar YUV 4:2:0 (1.5 bytes per pixel), JPEG encoded BGR frame
+    SUPPORTED_MIN_STREAM_QUALITY: typing.Final[int] = 0
+    SUPPORTED_MAX_STREAM_QUALITY: typing.Final[int] = 100
 
     def __init__(
         self,
@@ -58,6 +79,10 @@ class StreamerWorker:
         com_pattern: int,
         stream_frame_res: typing.Tuple[int, int],
         stream_fps: float,
+        zmq_sndhwm: int = 32,
+        zmq_conflate: bool = True,
+        stream_pixel_format: str = "bgr",
+        stream_quality: int = 85,
     ):
         """
         Stores all attributes needed to broadcast the stream.
@@ -71,21 +96,40 @@ class StreamerWorker:
                 resolution. Tuple representation is (frame_resolution_width, frame_resolution_height).
             stream_fps (float): FPS of the stream. Can be non-integer and even less than one. This is possible because
                 FPS is translated into stream frame latency is seconds.
+            zmq_sndhwm (int): ZeroMQ high water mark of outgoing messages. Value `0` means no limit. NetGear
+                overrides it with `1` for communication pattern `2`.
+            zmq_conflate (bool): Keep only the latest outgoing message in ZeroMQ queue. It is set for every
+                communication pattern, ZeroMQ applies it only for patterns `2` and `3`.
+            stream_pixel_format (str): Pixel format of streamed frames. `"bgr"` streams BGR frames of shape
+                (height, width, 3). `"yuv420p"` streams planar YUV 4:2:0 frames of shape (height * 3 / 2, width), which
+                halves the amount of sent data. Such frames are converted back by `cv.COLOR_YUV2BGR_I420` conversion.
+                It requires even stream frame resolution. `"jpeg"` streams JPEG encoded BGR frames as 1-dim byte arrays,
+                which are decoded by `cv.imdecode()`.
+            stream_quality (int): JPEG quality of streamed frames in range <0, 100>. It is used only for `"jpeg"`
+                pixel format.
         """
 
         # pylint: disable=too-many-arguments
         # Encapsulation in more classes would make instantiating process more complicated,
         # because Hydra instantiate feature is used.
 
-        shared_param_val.type_check(address, str)
-        shared_param_val.type_check(port, str)
-        shared_param_val.type_check(com_protocol, str)
-        shared_param_val.type_check(com_pattern, int)
-        shared_param_val.type_check(stream_frame_res[0], int)
-        shared_param_val.type_check(stream_frame_res[1], int)
-        shared_param_val.type_check(stream_fps, float)
+        if __debug__:
+            shared_param_val.type_check(address, str)
+            shared_param_val.type_check(port, str)
+            shared_param_val.type_check(com_protocol, str)
+            shared_param_val.type_check(com_pattern, int)
+            shared_param_val.type_check(stream_frame_res[0], int)
+            shared_param_val.type_check(stream_frame_res[1], int)
+            shared_param_val.type_check(stream_fps, float)
+            shared_param_val.type_check(zmq_sndhwm, int)
+            shared_param_val.type_check(zmq_conflate, bool)
+            shared_param_val.type_check(stream_pixel_format, str)
+            shared_param_val.type_check(stream_quality, int)
 
         shared_param_val.resolution_validity_check(stream_frame_res[0], stream_frame_res[1])
+        shared_param_val.parameter_value_in_range(
+            stream_quality, self.SUPPORTED_MIN_STREAM_QUALITY, self.SUPPORTED_MAX_STREAM_QUALITY
+        )
         shared_param_val.parameter_value_in_range(
             stream_fps, self.SUPPORTED_MIN_STREAM_FPS, self.SUPPORTED_MAX_STREAM_FPS
         )
@@ -102,12 +146,32 @@ class StreamerWorker:
                 f"supported patterns: {self.SUPPORTED_COM_PATTERNS}"
             )
 
+        if zmq_sndhwm < 0:
+            raise ValueError(f'Given <zmq_sndhwm> value "{zmq_sndhwm}" is negative.')
+
+        stream_pixel_format = stream_pixel_format.lower()
+        if stream_pixel_format not in self.SUPPORTED_STREAM_PIXEL_FORMATS:
+            raise ValueError(
+                f'Given <stream_pixel_format> value "{stream_pixel_format}" is not supported. List of supported pixel '
+                f"formats: {self.SUPPORTED_STREAM_PIXEL_FORMATS}"
+            )
+        if stream_pixel_format == "yuv420p" and (stream_frame_res[0] % 2 != 0 or stream_frame_res[1] % 2 != 0):
+            raise ValueError(
+                f'Given <stream_frame_res> value "{stream_frame_res}" has to be even for "yuv420p" '
+                f"<stream_pixel_format>."
+            )
+
         self._address = address
         self._port = port
         self._com_protocol = com_protocol
         self._com_pattern = com_pattern
         self._stream_fps = stream_fps
-        self._stream_frame_res = stream_frame_res
+        self._stream_frame_res = (stream_frame_res[0], stream_frame_res[1])
+        self._zmq_sndhwm = zmq_sndhwm
+        self._zmq_conflate = zmq_conflate
+        self._stream_pixel_format = stream_pixel_format
+        self._stream_quality = stream_quality
+        self._frame_slot = LatestSlot()
         self._debug_logging = bool(logging.getLogger().getEffectiveLevel() == logging.DEBUG)
         self._net_gear_streamer = NetGear_Async(
             address=self._address,
@@ -117,6 +181,14 @@ class StreamerWorker:
             logging=self._debug_logging,
         )
         self._net_gear_streamer.loop = metron_globals.event_loop
+        # NetGear does not expose socket options, but its socket is created from this context when streaming starts,
+        # therefore context default options are applied on the socket. The name-mangled private context attribute is
+        # specific to vidgear 0.2.1 NetGear_Async and it has to be revisited when vidgear is upgraded.
+        msg_context = self._net_gear_streamer._NetGear_Async__msg_context  # pylint: disable=protected-access
+        msg_context.setsockopt(zmq.SNDHWM, self._zmq_sndhwm)
+        msg_context.setsockopt(zmq.CONFLATE, int(self._zmq_conflate))
+        # frames which were not sent yet are stale when streaming stops, so they are dropped instead of blocking close
+        msg_context.setsockopt(zmq.LINGER, 0)
 
     def __enter__(self) -> StreamerWorker:
         """
@@ -154,44 +226,149 @@ class StreamerWorker:
         """
         return self._net_gear_streamer.task
 
+    def get_frame_slot(self) -> LatestSlot:
+        """
+        Returns slot into which source frames are put to be streamed.
+
+        Returns (shared.structures.LatestSlot): Frame slot.
+        """
+        return self._frame_slot
+
+    def get_stream_fps(self) -> float:
+        """
+        Returns FPS of the stream.
+
+        Returns (float): Stream FPS.
+        """
+        return self._stream_fps
+
     def set_frame_generator(self, source_connector: AbstractConnector) -> None:
         """
-        Sets frame generator to async NetGear.
+        Sets frame generator to async NetGear. The generator streams frames put into the frame slot.
 
         Args:
             source_connector (AbstractConnector): *Source Connector* which provides source stream resolution.
 
         Returns (None):
         """
-        shared_param_val.type_check(source_connector, AbstractConnector)
+        if __debug__:
+            shared_param_val.type_check(source_connector, AbstractConnector)
 
-        src_res = source_connector.get_stream_resolution()
+        resizing_func = self._get_resizing_func(source_connector.get_stream_resolution())
+        converting_func = self._get_converting_func()
 
-        # define resizing function used by <_frame_generator()> based on resolution
-        if src_res == self._stream_frame_res:
+        # frame processing is composed once, so frames which need neither resizing nor conversion are streamed without
+        # any per-frame function call
+        processing_func: typing.Optional[typing.Callable[[np.array], np.array]] = None
+        if resizing_func is not None and converting_func is not None:
+            resize, convert = resizing_func, converting_func
 
-            def resizing_func(img: np.array) -> np.array:
-                return img
+            def resize_and_convert(img: np.array) -> np.array:
+                return convert(resize(img))
 
+            processing_func = resize_and_convert
         else:
-
-            def resizing_func(img: np.array) -> np.array:
-                return cv.resize(img, self._stream_frame_res)
+            processing_func = resizing_func or converting_func
 
         async def _frame_generator() -> typing.AsyncGenerator:
-            video_source = source_connector
+            # per-frame callables are bound to local names, so the loop does not look them up in closure, global
+            # or attribute scope for every frame
+            get_frame = self._frame_slot.get
+            process = processing_func
+            sleep = asyncio.sleep
+            loop_time = metron_globals.event_loop.time
             frame_latency = 1.0 / self._stream_fps
+            # frames are paced by absolute deadlines, so time spent on reading and processing a frame does not
+            # decrease stream FPS
+            next_frame_time = loop_time()
 
             has_frame = True
-            while has_frame is not None:
-                frame = video_source.get_frame()
+            while has_frame:
+                frame = await get_frame()
 
+                # source frame buffers are reused by *Source Connector*, so the frame is processed and serialized by
+                # NetGear without giving control back to the event loop in between
                 if frame is not None:
-                    resized_frame = resizing_func(frame)
-                    yield resized_frame
-
-                    await asyncio.sleep(frame_latency)
+                    if process is not None:
+                        frame = process(frame)
+                    # NetGear serializes C-contiguous frames directly from the frame buffer, non-contiguous frames
+                    # would be copied before serialization
+                    yield frame
+
+                    next_frame_time += frame_latency
+                    frame_delay = next_frame_time - loop_time()
+                    if frame_delay > 0:
+                        await sleep(frame_delay)
+                    elif frame_delay < -frame_latency:
+                        # streaming is late by more than one frame, missed frames are dropped instead of being sent
+                        # in a burst
+                        next_frame_time = loop_time()
                 else:
                     has_frame = False
 
         self._net_gear_streamer.config["generator"] = _frame_generator()
+
+    def _get_resizing_func(
+        self, src_res: typing.Tuple[int, int]
+    ) -> typing.Optional[typing.Callable[[np.array], np.array]]:
+        """
+        Defines resizing function used by <_frame_generator()> based on source and stream resolution.
+
+        Args:
+            src_res (typing.Tuple[int, int]): Source stream resolution. Format [stream_width, stream_height].
+
+        Returns (typing.Optional[typing.Callable[[np.array], np.array]]): Resizing function. `None` means no resizing.
+        """
+        resizing_func: typing.Optional[typing.Callable[[np.array], np.array]] = None
+        if src_res != self._stream_frame_res:
+            stream_res = self._stream_frame_res
+            # area interpolation avoids aliasing when downscaling, linear interpolation is used for upscaling
+            is_downscaled = src_res[0] * src_res[1] > stream_res[0] * stream_res[1]
+            interpolation = cv.INTER_AREA if is_downscaled else cv.INTER_LINEAR
+            # NetGear serializes yielded frame before the next frame is resized, so preallocated output buffers are
+            # reused and yielded frame is valid until the next yield
+            resized_frame_buffers = itertools.cycle(
+                [np.empty((stream_res[1], stream_res[0], 3), dtype=np.uint8) for _ in range(_OUTPUT_BUFFER_COUNT)]
+            )
+
+            def resize_frame(img: np.array) -> np.array:
+                return cv.resize(img, stream_res, dst=next(resized_frame_buffers), interpolation=interpolation)
+
+            resizing_func = resize_frame
+
+        return resizing_func
+
+    def _get_converting_func(self) -> typing.Optional[typing.Callable[[np.array], np.array]]:
+        """
+        Defines pixel format conversion function used by <_frame_generator()>. Frames are provided in BGR format.
+
+        Returns (typing.Optional[typing.Callable[[np.array], np.array]]): Conversion function. `None` means no
+            conversion.
+        """
+        converting_func: typing.Optional[typing.Callable[[np.array], np.array]] = None
+        if self._stream_pixel_format == "yuv420p":
+            # converted frame is written into preallocated buffer right after resizing, while resized frame is still
+            # in CPU cache, the buffers are reused the same way as resizing output buffers
+            yuv_frame_buffers = itertools.cycle(
+                [
+                    np.empty((self._stream_frame_res[1] * 3 // 2, self._stream_frame_res[0]), dtype=np.uint8)
+                    for _ in range(_OUTPUT_BUFFER_COUNT)
+                ]
+            )
+
+            def convert_to_yuv(img: np.array) -> np.array:
+                return cv.cvtColor(img, cv.COLOR_BGR2YUV_I420, dst=next(yuv_frame_buffers))
+
+            converting_func = convert_to_yuv
+
+        elif self._stream_pixel_format == "jpeg":
+            encoding_params = [cv.IMWRITE_JPEG_QUALITY, self._stream_quality]
+
+            def encode_to_jpeg(img: np.array) -> np.array:
+                _, encoded_img = cv.imencode(".jpg", img, encoding_params)
+                # OpenCV returns column vector, it is flattened so it is distinguishable from YUV 4:2:0 frames
+                return encoded_img.reshape(-1)
+
+            converting_func = encode_to_jpeg
+
+        return converting_func
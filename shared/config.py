@@ -1,8 +1,8 @@
 """
-This module defines variable <config> which stores configuration of given Metron's component obtained by Hydra
-framework.
+This module defines context variable <config_var> which stores configuration of given Metron's component obtained by
+Hydra framework. Asyncio tasks and contexts copied afterwards inherit the configuration.
 
-<config> has to be initialized by using provided function decorator <set_hydra_config>,
+<config_var> has to be initialized by using provided function decorator <set_hydra_config>,
 which has to be used right after Hydra's <hydra.main> decorator. See the sample code:
 
 ```
@@ -11,31 +11,195 @@ which has to be used right after Hydra's <hydra.main> decorator. See the sample
 def main(cfg: DictConfig) -> None:
 ```
 
-<config> is obtained by using provided function / class method decorated <GetHydraConfig>, which passes Hydra's config
-as the first argument. See the sample code:
+<config_var> is obtained by using provided function / class method decorated <GetHydraConfig>, which passes Hydra's
+config as the first argument. See the sample code:
 
 ```
 @GetHydraConfig
 def do_something(hydra_config: DictConfig):
     ...
 ```
+
+Threads do not inherit context variables, including executor threads of <asyncio.AbstractEventLoop.run_in_executor>.
+Functions decorated by <GetHydraConfig> which are called from other threads have to be run in a copied context, e.g.
+`contextvars.copy_context().run(do_something)`. Otherwise <GetHydraConfig> raises `RuntimeError`.
+
+Composed Hydra's config can be cached by decorator <cache_hydra_config>, which has to be used right before Hydra's
+<hydra.main> decorator. Caching is opt-in, because Hydra's job setup is skipped when cached config is used. See the
+sample code:
+
+```
+@cache_hydra_config(config_dir="...", cache_file="...", source_files=[...], enabled=...)
+@hydra.main(config_path="...", config_name="...")
+@set_hydra_config
+def main(cfg: DictConfig) -> None:
+```
 """
 
+import os
+import sys
 import typing
-from functools import wraps
-from types import MethodType
+import hashlib
+import tempfile
+from contextvars import ContextVar
+from functools import partial, wraps
+import yaml
 from omegaconf import DictConfig, OmegaConf
+from omegaconf.errors import OmegaConfBaseException
 from shared.structures import Singleton
 
 
-config = None  # pylint: disable=invalid-name
+# no default value, so access from a context without the config fails loudly
+config_var: typing.Final[ContextVar[DictConfig]] = ContextVar("metron_config")
+# cache file path and config files fingerprint, set when composed config has to be cached by <set_hydra_config>
+_pending_config_cache: typing.Optional[typing.Tuple[str, str]] = None  # pylint: disable=invalid-name
+
+
+def _get_config_fingerprint(config_dir: str, source_files: typing.Sequence[str]) -> str:
+    """
+    Computes fingerprint of Hydra's config given by config files, source files defining the config (like config
+    schemas) and command line arguments. Files are represented by their path, modification time and size.
+
+    Args:
+        config_dir (str): Hydra's config directory.
+        source_files (typing.Sequence[str]): Source files which define the config.
+
+    Returns (str): Config fingerprint.
+    """
+    config_files = [
+        os.path.join(root, file_name)
+        for root, _, file_names in sorted(os.walk(config_dir))
+        for file_name in sorted(file_names)
+    ]
+    fingerprint = hashlib.sha256()
+    for file_path in [*config_files, *source_files]:
+        file_stat = os.stat(file_path)
+        fingerprint.update(f"{file_path}:{file_stat.st_mtime_ns}:{file_stat.st_size};".encode())
+    fingerprint.update(repr(sys.argv[1:]).encode())
+
+    return fingerprint.hexdigest()
+
+
+def _load_config_cache(cache_file: str, fingerprint: str) -> typing.Optional[DictConfig]:
+    """
+    Loads cached Hydra's config, if the cache exists and was created from the same config.
+
+    Args:
+        cache_file (str): Cache file path.
+        fingerprint (str): Fingerprint of current config.
+
+    Returns (typing.Optional[DictConfig]): Cached Hydra's config. If cache is missing, stale or corrupted, `None` is
+        returned.
+    """
+    if not os.path.isfile(cache_file):
+        return None
+
+    try:
+        cache = OmegaConf.load(cache_file)
+    except (OSError, yaml.YAMLError, OmegaConfBaseException):
+        return None
+    if not isinstance(cache, DictConfig) or cache.get("fingerprint") != fingerprint:
+        return None
+
+    cached_config = cache.get("config")
+    if not isinstance(cached_config, DictConfig):
+        return None
+    OmegaConf.set_struct(cached_config, True)
+    return cached_config
+
+
+def _save_config_cache(cfg: DictConfig, cache_file: str, fingerprint: str) -> None:
+    """
+    Saves resolved Hydra's config into cache file. The config is written into temporary file first, which then
+    replaces the cache file, so interrupted saving does not leave truncated cache. Cache is optional, therefore failed
+    saving is ignored.
+
+    Args:
+        cfg (DictConfig): Hydra's config.
+        cache_file (str): Cache file path.
+        fingerprint (str): Fingerprint of the config.
+
+    Returns (None):
+    """
+    cache = OmegaConf.create({"fingerprint": fingerprint, "config": OmegaConf.to_container(cfg, resolve=True)})
+    cache_dir = os.path.dirname(cache_file)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_file_descriptor, temp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(temp_file_descriptor, "w", encoding="utf-8") as temp_file_stream:
+            OmegaConf.save(cache, temp_file_stream)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+
+def cache_hydra_config(
+    config_dir: str, cache_file: str, source_files: typing.Sequence[str] = (), enabled: bool = False
+) -> typing.Callable[[typing.Callable[..., typing.Any]], typing.Callable[..., typing.Any]]:
+    """
+    Decorator used to skip Hydra's config composition and validation when neither config files, source files defining
+    the config nor command line arguments have changed since the last run. Composed config is cached by
+    <set_hydra_config> and passed directly to the main function on following runs. Hydra's job setup, like logging
+    configuration, output directory or `hydra.verbose` handling, is skipped with cached config too, therefore caching
+    has to be explicitly enabled. The decorator has to be used right before Hydra's decorator <hydra.main>.
+
+    Args:
+        config_dir (str): Hydra's config directory.
+        cache_file (str): Path of the file where composed config is cached.
+        source_files (typing.Sequence[str]): Source files which define the config, like config schema modules. Cache
+            is invalidated when any of them is changed.
+        enabled (bool): If `False`, Hydra's main function is returned unchanged and no config is cached.
+
+    Returns (typing.Callable[[typing.Callable[..., typing.Any]], typing.Callable[..., typing.Any]]): Decorator of
+        Hydra's main function.
+    """
+
+    def cache_decorator(hydra_main_func: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+        """
+        Decorates Hydra's main function.
+
+        Args:
+            hydra_main_func (typing.Callable[..., typing.Any]): Hydra's main function.
+
+        Returns (typing.Callable[..., typing.Any]): Decorated Hydra's main function.
+        """
+        if not enabled:
+            return hydra_main_func
+
+        @wraps(hydra_main_func)
+        def cached_hydra_main() -> typing.Any:
+            """
+            Passes cached config to Hydra's main function, which then calls decorated function directly. If cache is
+            missing or stale, Hydra composes the config and it is cached.
+
+            Returns (typing.Any): Return value of Hydra's main function.
+            """
+            global _pending_config_cache  # pylint: disable=global-statement, invalid-name
+            fingerprint = _get_config_fingerprint(config_dir, source_files)
+            cached_config = _load_config_cache(cache_file, fingerprint)
+            if cached_config is not None:
+                return hydra_main_func(cached_config)
+
+            _pending_config_cache = (cache_file, fingerprint)
+            return hydra_main_func()
+
+        return cached_hydra_main
+
+    return cache_decorator
 
 
 @Singleton
 def set_hydra_config(main_function: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
     """
-    Decorator used to initializes global <config> variable with Hydra's config. The decorator has to be be called once,
-    right after the Hydra's decorator <hydra.main>.
+    Decorator used to initializes <config_var> context variable with Hydra's config. The decorator has to be be called
+    once, right after the Hydra's decorator <hydra.main>.
 
     Args:
         main_function (typing.Callable[..., typing.Any]): Main script function which performs program orchestration.
@@ -46,26 +210,49 @@ def set_hydra_config(main_function: typing.Callable[..., typing.Any]) -> typing.
     @wraps(main_function)
     def decorated_function(cfg: DictConfig) -> DictConfig:
         """
-        Decorating function which initializes global <config> variable with Hydra's configuration.
+        Decorating function which initializes <config_var> context variable with Hydra's configuration.
 
         Args:
             cfg (DictConfig): Hydra's configuration.
 
         Returns (DictConfig): Hydra's configuration.
         """
-        global config  # pylint: disable=global-statement, invalid-name
+        global _pending_config_cache  # pylint: disable=global-statement, invalid-name
+        pending_config_cache = _pending_config_cache
+        if pending_config_cache is not None:
+            cache_file, fingerprint = pending_config_cache
+            _save_config_cache(cfg, cache_file, fingerprint)
+            _pending_config_cache = None
         OmegaConf.set_readonly(cfg, True)
-        config = cfg
+        config_var.set(cfg)
 
         return main_function(cfg)
 
     return decorated_function
 
 
+def _get_config() -> DictConfig:
+    """
+    Gets Hydra's config stored in <config_var> context variable.
+
+    Returns (DictConfig): Hydra's config.
+
+    Exceptions:
+        RuntimeError: If the config is not set in the current context.
+    """
+    try:
+        return config_var.get()
+    except LookupError as lookup_error:
+        raise RuntimeError(
+            "Hydra's config is not set in the current context. Use <set_hydra_config> decorator and run functions in "
+            "other threads with `contextvars.copy_context().run()`."
+        ) from lookup_error
+
+
 class GetHydraConfig:
     """
-    Decorator used to get global <config> variable storing Hydra's config. The decorated might be applied on a function
-    or a class method. It passes into decorated function / method the config as the first argument.
+    Decorator used to get <config_var> context variable storing Hydra's config. The decorated might be applied on
+    a function or a class method. It passes into decorated function / method the config as the first argument.
 
     Attributes:
         _decorated_func (typing.Any): Function / method on which the decorator is applied.
@@ -82,7 +269,7 @@ class GetHydraConfig:
 
     def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Callable[..., typing.Any]:
         """
-        Passes Hydra's config, stored in <config> global variable, as a first argument of the function / method.
+        Passes Hydra's config, stored in <config_var> context variable, as a first argument of the function / method.
         The method is called when decorator is applied on class method or function.
 
         Args:
@@ -91,13 +278,17 @@ class GetHydraConfig:
 
         Returns (typing.Callable[..., typing.Any]): Decorated function which takes Hydra's config as the
             first input argument.
+
+        Exceptions:
+            RuntimeError: If Hydra's config is not set in the current context.
         """
-        global config  # pylint: disable=global-statement, invalid-name
-        return self._decorated_func(config, *args, **kwargs)
+        return self._decorated_func(_get_config(), *args, **kwargs)
 
     def __get__(self, instance: typing.Any, owner: typing.Any) -> typing.Any:
         """
-        The method is needed to work with class method.
+        The method is needed to work with class method. It binds <_call_method()> to the decorator and the instance
+        with a single partial object per lookup, so no intermediate bound method is created and nothing is stored on
+        the instance.
 
         Args:
             instance (typing.Any): Class instance.
@@ -105,4 +296,24 @@ class GetHydraConfig:
 
         Returns (typing.Any):
         """
-        return self.__class__(MethodType(self._decorated_func, instance))
+        if instance is None:
+            return self
+
+        return partial(type(self)._call_method, self, instance)
+
+    def _call_method(self, instance: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        """
+        Passes Hydra's config, stored in <config_var> context variable, as a first argument of the class method,
+        right after the instance.
+
+        Args:
+            instance (typing.Any): Class instance.
+            *args (typing.Any): Positional arguments.
+            **kwargs (typing.Any): Key-worded arguments.
+
+        Returns (typing.Any): Return value of decorated method.
+
+        Exceptions:
+            RuntimeError: If Hydra's config is not set in the current context.
+        """
+        return self._decorated_func(instance, _get_config(), *args, **kwargs)
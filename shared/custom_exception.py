@@ -2,20 +2,28 @@
 This file defines custom exceptions.
 """
 
+from __future__ import annotations
 
 import typing
 from shared import param_validators as shared_param_val
 
+_INT_OR_NONE: typing.Final[typing.Tuple[type, type]] = (int, shared_param_val.NONE_TYPE)
+_STR_OR_NONE: typing.Final[typing.Tuple[type, type]] = (str, shared_param_val.NONE_TYPE)
+# template messages of commonly used camera ids are prepared in advance
+_CAM_MSG_CACHE: typing.Final[typing.Dict[int, str]] = {
+    cam_id: f"Camera device `{cam_id}` is not found." for cam_id in range(16)
+}
+
 
 class IOCamDevError(IOError):
     """
     Camera device is not found exception.
 
     Attributes:
-        message (str): Exception message.
+        message (str): Exception message. It is stored as the first exception argument.
     """
 
-    def __init__(self, msg: typing.Union[str, None] = None, accessed_cam_id: typing.Union[int, None] = None):
+    def __init__(self, msg: typing.Optional[str] = None, accessed_cam_id: typing.Optional[int] = None):
         """
         Two ways of use.
 
@@ -34,20 +42,29 @@ class IOCamDevError(IOError):
         If no input argument is passed, than empty error message is used.
 
         Args:
-            msg (typing.Union[str, None]): String to be used as an error message, it is optional.
-            accessed_cam_id (typing.Union[int]): Accessed camera id for which exception is raised, it is optional.
+            msg (typing.Optional[str]): String to be used as an error message, it is optional.
+            accessed_cam_id (typing.Optional[int]): Accessed camera id for which exception is raised, it is optional.
         """
-        shared_param_val.type_check(accessed_cam_id, (int, type(None)))
-        shared_param_val.type_check(msg, (str, type(None)))
-        msg = msg or ""
-        msg = repr(msg)  # convert anything to string
-
+        # full type checks are called only if the cheap exact type checks fail
+        if accessed_cam_id is not None and type(accessed_cam_id) is not int:  # pylint: disable=unidiomatic-typecheck
+            shared_param_val.type_check(accessed_cam_id, _INT_OR_NONE)
+        if msg is not None and type(msg) is not str:  # pylint: disable=unidiomatic-typecheck
+            shared_param_val.type_check(msg, _STR_OR_NONE)
         if accessed_cam_id is not None:
-            self.message = f"Camera device `{accessed_cam_id}` is not found."
+            message = _CAM_MSG_CACHE.get(accessed_cam_id) or f"Camera device `{accessed_cam_id}` is not found."
         else:
-            self.message = msg
+            message = msg or ""  # <msg> is already validated to be string or None
+
+        super().__init__(message)
 
-        super().__init__(self.message)
+    @property
+    def message(self) -> str:
+        """
+        Gets exception message.
+
+        Returns (str): Exception message.
+        """
+        return typing.cast(str, self.args[0])
 
     def __str__(self) -> str:
         """
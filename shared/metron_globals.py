@@ -2,6 +2,16 @@
 Metron global common variables and constants.
 """
 
+import sys
 import asyncio
 
+# event loop policy has to be set before the event loop is created, otherwise default asyncio loop is used
+if sys.platform == "win32":
+    # ZeroMQ asyncio sockets used by NetGear do not support default Windows proactor event loop
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore[attr-defined]
+else:
+    import uvloop
+
+    uvloop.install()
+
 event_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
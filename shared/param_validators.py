@@ -3,8 +3,67 @@ The module provides parameter validation functions common across Metron's compon
 parameters, except validation of YAML config parameters.
 """
 
+from __future__ import annotations
+
 import os
 import typing
+import functools
+
+NONE_TYPE: typing.Final[type] = type(None)
+# files existence is static during the program run, so results of file system lookups are cached
+_IS_FILE: typing.Final[typing.Callable[[str], bool]] = functools.lru_cache(maxsize=256)(os.path.isfile)
+
+
+# error raising is kept in separate functions, so that validators contain only the checks which are always executed
+def _raise_type_error(variable: typing.Any, expected_type: typing.Any) -> typing.NoReturn:
+    """
+    Raises type error of <type_check()>.
+
+    Args:
+        variable (typing.Any): Variable.
+        expected_type (typing.Any): Type.
+
+    Returns (typing.NoReturn):
+
+    Exceptions:
+        TypeError: Always raised.
+    """
+    raise TypeError(f"Given variable value `{variable}` does not meet expected type `{expected_type}`.")
+
+
+def _raise_resolution_error(res_width: int, res_height: int) -> typing.NoReturn:
+    """
+    Raises resolution error of <resolution_validity_check()>.
+
+    Args:
+        res_width (int): Resolution width.
+        res_height (int): Resolution height.
+
+    Returns (typing.NoReturn):
+
+    Exceptions:
+        ValueError: Always raised.
+    """
+    raise ValueError(f"Resolution `{res_width}x{res_height}` has dimension lower or equal to zero.")
+
+
+def _raise_range_error(
+    param_value: typing.Union[int, float], lower_bound: typing.Union[int, float], upper_bound: typing.Union[int, float]
+) -> typing.NoReturn:
+    """
+    Raises out of range error of <parameter_value_in_range()>.
+
+    Args:
+        param_value (typing.Union[int, float]): Parameter value.
+        lower_bound (typing.Union[int, float]): Lower bound of allowed parameter values.
+        upper_bound (typing.Union[int, float]): Upper bound of allowed parameter values.
+
+    Returns (typing.NoReturn):
+
+    Exceptions:
+        ValueError: Always raised.
+    """
+    raise ValueError(f"Given `{param_value}` is out of the allowed range <{lower_bound}, {upper_bound}>.")
 
 
 def type_check(variable: typing.Any, expected_type: typing.Any) -> None:
@@ -20,8 +79,14 @@ def type_check(variable: typing.Any, expected_type: typing.Any) -> None:
     Exceptions:
         TypeError: Raised if <variable> is not type of <expected_type>.
     """
+    variable_type = type(variable)
+    # exact type match is the most common case and it is cheaper than <isinstance()> MRO walk
+    if variable_type is expected_type or (
+        type(expected_type) is tuple and variable_type in expected_type  # pylint: disable=unidiomatic-typecheck
+    ):
+        return
     if not isinstance(variable, expected_type):
-        raise TypeError(f"Given variable value `{variable}` does not meet expected type `{expected_type}`.")
+        _raise_type_error(variable, expected_type)
 
 
 def resolution_validity_check(res_width: int, res_height: int) -> None:
@@ -37,17 +102,17 @@ def resolution_validity_check(res_width: int, res_height: int) -> None:
     Exceptions:
         ValueError: If resolution width or height is lower or equal to zero.
     """
-    type_check(res_width, int)
-    type_check(res_height, int)
-    if res_width <= 0:
-        raise ValueError(f"Resolution width `{res_width}` is lower or equal to zero.")
-    if res_height <= 0:
-        raise ValueError(f"Resolution height `{res_height}` is lower or equal to zero.")
+    # full type checks are done only if the cheap exact type check fails
+    if type(res_width) is not int or type(res_height) is not int:  # pylint: disable=unidiomatic-typecheck
+        type_check(res_width, int)
+        type_check(res_height, int)
+    if res_width <= 0 or res_height <= 0:
+        _raise_resolution_error(res_width, res_height)
 
 
 def file_existence_check(file_path: str) -> None:
     """
-    Validates if file path exists.
+    Validates if file path exists. Results are cached, use <clear_file_existence_cache()> if files are changed.
 
     Args:
         file_path (str): File path.
@@ -58,10 +123,20 @@ def file_existence_check(file_path: str) -> None:
         OSError: If file does not exist.
     """
     type_check(file_path, str)
-    if not os.path.isfile(file_path):
+    if not _IS_FILE(file_path):
         raise OSError(f"Path `{file_path}` is not a file.")
 
 
+def clear_file_existence_cache() -> None:
+    """
+    Clears cached results of <file_existence_check()>.
+
+    Returns (None):
+    """
+    # mypy [attr-defined] is ignored because <_IS_FILE> is wrapped by <functools.lru_cache>
+    _IS_FILE.cache_clear()  # type: ignore[attr-defined]
+
+
 def parameter_value_in_range(
     param_value: typing.Union[int, float], lower_bound: typing.Union[int, float], upper_bound: typing.Union[int, float]
 ) -> None:
@@ -76,10 +151,17 @@ def parameter_value_in_range(
     Returns (None):
 
     Exceptions:
+        TypeError: If values can not be compared.
         ValueError: If value is not in the range.
     """
-    type_check(param_value, (int, float))
-    type_check(lower_bound, (int, float))
-    type_check(upper_bound, (int, float))
-    if param_value < lower_bound or param_value > upper_bound:
-        raise ValueError(f"Given `{param_value}` is out of the allowed range" f" <{lower_bound}, {upper_bound}>.")
+    # comparison raises <TypeError> itself on incompatible types, so no explicit type checks are needed
+    try:
+        # negated chained comparison rejects NaN values as well
+        out_of_range = not lower_bound <= param_value <= upper_bound
+    except TypeError as type_error:
+        raise TypeError(
+            f"Given values `{param_value}`, `{lower_bound}`, `{upper_bound}` do not meet expected type"
+            f" `{(int, float)}`."
+        ) from type_error
+    if out_of_range:
+        _raise_range_error(param_value, lower_bound, upper_bound)
@@ -2,79 +2,140 @@
 This module provides data structures/patterns (classes or decorators).
 """
 
+from __future__ import annotations
 
 import typing
-from types import MethodType
+import asyncio
+import functools
+import itertools
 
+# decorated callable type, it lets type checkers keep signature of the decorated object, decorated class stays a class
+_DecoratedT = typing.TypeVar("_DecoratedT", bound=typing.Callable[..., typing.Any])
 
-class Singleton:
+
+# class-like name is kept, because the decorator represents a design pattern and it is applied on classes as well
+def Singleton(decorated_object: _DecoratedT) -> _DecoratedT:  # pylint: disable=invalid-name
     """
     Represents singleton data pattern applicable on class / function / method . When applied on a class,
     only one instance of the class is allowed for whole program lifespan. When applied on a function / method , only
     one call is allowed for whole program lifespan. The decorator can be applied on more classes / functions / methods,
-    not only on one object of the program. It does not change decorated object.
-
-    Attributes:
-        _called (typing.Set[typing.Any]): Set data structure which keeps one use across classes / functions / methods.
-        _function (typing.Any): Class / function / method on which the decorator is applied.
-    """
-
-    _called: typing.Set[typing.Any] = set()
-
-    def __init__(self, decorated_object: typing.Any):
-        """
-        Saves decorated object as attribute, for later lookup.
+    not only on one object of the program. Decorated class is returned unchanged, only its instantiation is guarded,
+    so it still can be used in <isinstance()> checks and subclassed. Instantiation of subclasses is not limited.
+    Decorated function / method is wrapped by a plain function, so there is no descriptor dispatch overhead and methods
+    are bound as any other function.
 
-        Args:
-            decorated_object (typing.Any): Decorated object.
-        """
-        self._decorated_object = decorated_object
+    Args:
+        decorated_object (_DecoratedT): Decorated class / function / method.
 
-    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+    Returns (_DecoratedT): Decorated class or wrapped decorated function / method.
+    """
+    # <next()> on <itertools.count> is a single atomic call under GIL, so concurrent calls can not pass both
+    call_counter = itertools.count()
+
+    if isinstance(decorated_object, type):
+        decorated_class = decorated_object
+        original_new: typing.Callable[..., typing.Any] = decorated_class.__new__
+
+        def guarded_new(cls: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            """
+            It checks if decorated class was not already instantiated. If does not, it allows to create it.
+
+            Args:
+                cls (typing.Any): Instantiated class.
+                *args (typing.Any): Positional arguments.
+                **kwargs (typing.Any): Key-worded arguments.
+
+            Returns (Typing.Any): New instance.
+
+            Exceptions:
+                RuntimeError: Violence of singleton paradigm of decorated class.
+            """
+            if cls is decorated_class and next(call_counter) > 0:
+                raise RuntimeError(f"Decorated {decorated_class} as `Singleton` can be instantiated only once!")
+            # <object.__new__()> does not accept constructor arguments once <__new__()> is overridden
+            if original_new is object.__new__:
+                return original_new(cls)
+            return original_new(cls, *args, **kwargs)
+
+        # mypy [assignment] is ignored because <__new__()> of the decorated class is replaced on purpose
+        decorated_class.__new__ = staticmethod(guarded_new)  # type: ignore[assignment]
+        return typing.cast(_DecoratedT, decorated_class)
+
+    @functools.wraps(decorated_object)
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
         """
-        It checks if decorated object was not already instantiated or called.
-        If does not, it allows to create / call it. The method is called when decorator
-        is applied on class / function / method.
+        It checks if decorated object was not already instantiated or called. If does not, it allows to create /
+        call it.
 
         Args:
             *args (typing.Any): Positional arguments.
             **kwargs (typing.Any): Key-worded arguments.
 
-        Returns (Typing.Any): Decorated object itself without change.
+        Returns (Typing.Any): Result of decorated object call.
 
         Exceptions:
-            Exception: Violence of singleton paradigm of decorated object.
+            RuntimeError: Violence of singleton paradigm of decorated object.
+        """
+        if next(call_counter):
+            raise RuntimeError(f"Decorated {decorated_object} as `Singleton` can be called / instantiated only once!")
+
+        return decorated_object(*args, **kwargs)
+
+    # classes are returned above, so the cast covers only functions / methods, whose call signature is kept by
+    # the wrapper
+    return typing.cast(_DecoratedT, wrapper)
+
+
+class LatestSlot:
+    """
+    Single-slot asynchronous container which keeps only the latest put item. Putting a new item overwrites the item
+    which was not taken yet, so consumer always gets the newest item and is never delayed by stale items. Producer
+    is never blocked. The slot has to be used within one event loop, <put()> and <get()> have to be called from
+    the event loop thread.
+
+    Attributes:
+        _item (typing.Any): The latest put item.
+        _has_item (typing.Optional[asyncio.Event]): It is set if there is an item which was not taken yet. It is
+            created on the first use, so it is bound to the running event loop, not to the current event loop at the
+            time of the slot creation (Python 3.8 binds <asyncio.Event> on creation).
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates empty slot.
         """
-        if self._decorated_object not in self._called:
-            self._called.add(self._decorated_object)
-        else:
-            raise Exception(
-                f"Decorated {self._decorated_object} as `Singleton` can be called " f"/ instantiated only once!"
-            )
+        self._item: typing.Any = None
+        self._has_item: typing.Optional[asyncio.Event] = None
 
-        return self._decorated_object(*args, **kwargs)
+    def _get_has_item(self) -> asyncio.Event:
+        """
+        Returns <_has_item> event. It is created if it does not exist yet.
 
-    def __get__(self, instance: typing.Any, owner: typing.Any) -> typing.Any:
+        Returns (asyncio.Event): Event signalling not taken item.
         """
-        The method is needed to work with class method.
+        if self._has_item is None:
+            self._has_item = asyncio.Event()
+        return self._has_item
 
-        Args:
-            instance (typing.Any): Class instance.
-            owner (typing.Any): Instance class owner.
+    def put(self, item: typing.Any) -> None:
+        """
+        Puts the item into the slot. Not taken item is dropped.
 
-        Returns (typing.Any):
+        Args:
+            item (typing.Any): Put item.
 
-        Exceptions:
-            Exception: Violence of singleton paradigm of decorated object.
+        Returns (None):
         """
-        if instance is None:
-            return self
+        self._item = item
+        self._get_has_item().set()
 
-        if owner not in self._called:
-            self._called.add(owner)
-        else:
-            raise Exception(
-                f"Decorated {self._decorated_object} as `Singleton` can be called " f"/ instantiated only once!"
-            )
+    async def get(self) -> typing.Any:
+        """
+        Takes the latest item from the slot. It waits until there is an item which was not taken yet.
 
-        return self.__class__(MethodType(self._decorated_object, instance))
+        Returns (typing.Any): The latest item.
+        """
+        has_item = self._get_has_item()
+        await has_item.wait()
+        has_item.clear()
+        return self._item